@@ -0,0 +1,47 @@
+"""Cold-start wall time of the compute-only path vs runs that import matplotlib.
+
+Every case runs in a fresh interpreter (as a CI job would); the median of ``--repeat`` runs is reported.
+
+Run from the repository root:
+    python -m benchmarks.bench_cold_start --repeat 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+CASES = [
+    ("interpreter only", ["-c", "pass"]),
+    ("import numpy", ["-c", "import numpy"]),
+    ("import pt_slab", ["-c", "import pt_slab"]),
+    ("import pt_slab + matplotlib.pyplot", ["-c", "import pt_slab, matplotlib.pyplot"]),
+    ("optimize_slab, highs backend", ["-c", "from pt_slab import optimize_slab; optimize_slab(lp_backend='highs')"]),
+    ("optimize_slab, cvxpy backend", ["-c", "from pt_slab import optimize_slab; optimize_slab()"]),
+    ("script --no-plot", ["pt_slab_optimization_commented.py", "--no-plot"]),
+    ("script with plots (Agg backend)", ["pt_slab_optimization_commented.py"]),
+]
+
+
+def run(args):
+    env = dict(os.environ, MPLBACKEND="Agg")
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, *args], check=True, env=env, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(CASES[0][1])  # warm the OS file cache once
+    print(f"{'case':<36} {'median (s)':>10} {'min (s)':>8}")
+    for label, case in CASES:
+        times = [run(case) for _ in range(args.repeat)]
+        print(f"{label:<36} {statistics.median(times):>10.3f} {min(times):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Influence matrix build: per-point Python loop vs broadcast builder.
+
+Run from the repository root:
+    python -m benchmarks.bench_influence_build
+    python -m benchmarks.bench_influence_build --sizes 1e4 1e5 --repeat 3
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from benchmarks.default_slab import Ly, Lx, e_design, t_slab, tendon_x_positions
+from pt_slab.geometry import control_grid
+from pt_slab.influence import build_influence_matrix, tendon_influence_with_eccentricity
+
+
+def build_loop(X, Y):
+    A = []
+    for x_cp, y_cp in zip(X, Y):
+        A.append([tendon_influence_with_eccentricity(x_t, x_cp, y_cp, Ly, e_design, t_slab)
+                  for x_t in tendon_x_positions])
+    return np.array(A)
+
+
+def build_vectorized(X, Y):
+    return build_influence_matrix(X, Y, tendon_x_positions, Ly, e_design, t_slab)
+
+
+def best_time(fn, *args, repeat=1):
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e4, 1e5, 1e6])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'Npc':>10} {'loop (s)':>10} {'vector (s)':>11} {'speedup':>9} {'max |diff|':>11}")
+    for size in args.sizes:
+        grid = control_grid(Lx, Ly, int(size))
+        X, Y = grid.X, grid.Y
+        t_loop, A_loop = best_time(build_loop, X, Y, repeat=args.repeat)
+        t_vec, A_vec = best_time(build_vectorized, X, Y, repeat=args.repeat)
+        err = np.abs(A_loop - A_vec).max()
+        print(f"{len(X):>10} {t_loop:>10.3f} {t_vec:>11.4f} {t_loop / t_vec:>8.0f}x {err:>11.2e}")
+
+
+if __name__ == "__main__":
+    main()
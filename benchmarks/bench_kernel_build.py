@@ -0,0 +1,83 @@
+"""General influence kernels: Python double loop vs NumPy row blocks vs Numba prange.
+
+Uses a non-separable kernel (lateral spread widening towards the supports) and the
+default separable one. Numba is optional; its column shows "n/a" when not installed
+(the first Numba call, which compiles the kernel, is excluded from the timing).
+
+Run from the repository root:
+    python -m benchmarks.bench_kernel_build
+    python -m benchmarks.bench_kernel_build --sizes 1e4 1e5 --loop-max 1e4
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from benchmarks.default_slab import Ly, Lx, e_design, t_slab, tendon_x_positions
+from pt_slab.geometry import control_grid
+from pt_slab.kernels import build_kernel_matrix, numba_available, separable_kernel
+
+
+def spreading_kernel(x_cp, y_cp, x_tendon, params):
+    """Gaussian whose width grows linearly from midspan to the supports (not separable)."""
+    Ly, e_design, t_slab, sigma0, spread = params[0], params[1], params[2], params[3], params[4]
+    sigma = sigma0 * (1 + spread * abs(2 * y_cp / Ly - 1))
+    dx = x_cp - x_tendon
+    ecc = 4 * e_design * (y_cp / Ly) * (1 - y_cp / Ly)
+    return np.exp(-(dx * dx) / (2 * sigma * sigma)) * (sigma0 / sigma) * (1 + ecc / (t_slab / 2))
+
+
+KERNELS = {
+    "separable": (separable_kernel, np.array([Ly, e_design, t_slab, 0.75])),
+    "spreading": (spreading_kernel, np.array([Ly, e_design, t_slab, 0.75, 0.5])),
+}
+
+
+def build_loop(X, Y, kernel, params):
+    A = []
+    for x_cp, y_cp in zip(X, Y):
+        A.append([kernel(x_cp, y_cp, x_t, params) for x_t in tendon_x_positions])
+    return np.array(A)
+
+
+def best_time(fn, *args, repeat=1, **kwargs):
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e4, 1e5, 1e6])
+    parser.add_argument("--loop-max", type=float, default=1e5, help="largest Npc timed with the Python loop")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    has_numba = numba_available()
+    print(f"{'kernel':<10} {'Npc':>9} {'loop (s)':>9} {'numpy (s)':>10} {'numba (s)':>10} {'max |diff|':>11}")
+    for name, (kernel, params) in KERNELS.items():
+        if has_numba:  # compile outside the timings
+            build_kernel_matrix([0.0], [0.0], tendon_x_positions, kernel, params, engine="numba")
+        for size in args.sizes:
+            grid = control_grid(Lx, Ly, int(size))
+            X, Y = grid.X, grid.Y
+            t_np, A = best_time(build_kernel_matrix, X, Y, tendon_x_positions, kernel, params, engine="numpy",
+                                repeat=args.repeat)
+            t_loop = t_nb = "n/a"
+            err = 0.0
+            if size <= args.loop_max:
+                t, A_loop = best_time(build_loop, X, Y, kernel, params, repeat=args.repeat)
+                t_loop, err = f"{t:.3f}", max(err, np.abs(A_loop - A).max())
+            if has_numba:
+                t, A_nb = best_time(build_kernel_matrix, X, Y, tendon_x_positions, kernel, params, engine="numba",
+                                    repeat=args.repeat)
+                t_nb, err = f"{t:.4f}", max(err, np.abs(A_nb - A).max())
+            print(f"{name:<10} {len(X):>9} {t_loop:>9} {t_np:>10.4f} {t_nb:>10} {err:>11.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Many load cases on one slab: rebuild the cvxpy problem each time vs StrandLP compiled once.
+
+Run from the repository root:
+    python -m benchmarks.bench_load_cases --cases 200
+"""
+import argparse
+import time
+
+import cvxpy as cp
+import numpy as np
+
+from benchmarks.default_slab import Ly, Lx, default_targets, e_design, n_cord_max, stress_per_tendon, t_slab, \
+    tendon_x_positions
+from pt_slab.geometry import control_grid
+from pt_slab.influence import build_influence_matrix
+from pt_slab.solvers import StrandLP
+
+
+def load_cases(X, Y, count, seed=0):
+    """Parabolic base case scaled and perturbed per combination."""
+    rng = np.random.default_rng(seed)
+    base = default_targets(Y)
+    for _ in range(count):
+        yield base * rng.uniform(0.6, 1.0) + rng.uniform(0, 0.5) * np.sin(X * rng.uniform(0.2, 1.0))
+
+
+def solve_rebuild(A, load_vector):
+    n = cp.Variable(A.shape[1])
+    problem = cp.Problem(cp.Minimize(cp.sum(n)),
+                         [A @ (n * stress_per_tendon) >= load_vector, n >= 0, n <= n_cord_max])
+    problem.solve(solver=cp.ECOS)
+    return problem.value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=100)
+    parser.add_argument("--npc", type=int, default=10000, help="control points")
+    args = parser.parse_args()
+
+    grid = control_grid(Lx, Ly, args.npc)
+    X, Y = grid.X, grid.Y
+    A = build_influence_matrix(X, Y, tendon_x_positions, Ly, e_design, t_slab)
+    cases = list(load_cases(X, Y, args.cases))
+
+    t0 = time.perf_counter()
+    rebuilt = [solve_rebuild(A, b) for b in cases]
+    t_rebuild = time.perf_counter() - t0
+
+    results = {}
+    for reduce in (False, True):
+        t0 = time.perf_counter()
+        lp = StrandLP(A, stress_per_tendon, n_cord_max, reduce=reduce)
+        objectives = [lp.solve(b).objective for b in cases]
+        results[reduce] = time.perf_counter() - t0, np.abs(np.subtract(objectives, rebuilt)).max()
+
+    print(f"{len(cases)} load cases, {len(X)} control points, {A.shape[1]} tendons")
+    print(f"{'rebuild every case':<28} {t_rebuild:8.2f} s")
+    for reduce, (elapsed, err) in results.items():
+        label = "StrandLP" + (" (reduced)" if reduce else "")
+        print(f"{label:<28} {elapsed:8.2f} s  {t_rebuild / elapsed:6.1f}x  max |Δobjective| = {err:.1e}")
+
+
+if __name__ == "__main__":
+    main()
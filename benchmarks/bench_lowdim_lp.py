@@ -0,0 +1,73 @@
+"""Full (unreduced) strand LP: cvxpy + ECOS vs the low-dimensional interior-point solver.
+
+Each (solver, size) runs in a fresh process so that peak RSS is measured per solve.
+ECOS is skipped above ``--ecos-max`` control points (its canonicalized problem grows
+with Npc × T nonzeros and quickly exhausts memory); pass ``--ecos-max 1e7`` to force it.
+The objective of every interior-point run is compared with ECOS (or HiGHS when ECOS
+was skipped) at the same size.
+
+Run from the repository root:
+    python -m benchmarks.bench_lowdim_lp
+    python -m benchmarks.bench_lowdim_lp --sizes 1e4 1e5 1e6 1e7 --ecos-max 1e5
+"""
+import argparse
+import multiprocessing as mp
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.bench_lp_backends import peak_rss_mb
+from benchmarks.default_slab import (
+    Ly, Lx, default_targets, e_design, n_cord_max, stress_per_tendon, t_slab, tendon_x_positions,
+)
+
+
+def run_case(backend_name, Npc, influence_mode):
+    from pt_slab.backends import get_backend
+    from pt_slab.geometry import control_grid
+    from pt_slab.influence import build_influence_matrix
+    from pt_slab.operators import InfluenceOperator
+
+    grid = control_grid(Lx, Ly, Npc)
+    if influence_mode == "operator":
+        A = InfluenceOperator.from_grid(grid.x_control, grid.y_control, tendon_x_positions, Ly, e_design, t_slab)
+    else:
+        A = build_influence_matrix(grid.X, grid.Y, tendon_x_positions, Ly, e_design, t_slab)
+    load_vector = default_targets(grid.Y)
+
+    backend = get_backend("cvxpy" if backend_name == "ecos" else backend_name)
+    rss_before = peak_rss_mb()
+    t0 = time.perf_counter()
+    result = backend.solve(A, load_vector, stress_per_tendon, n_cord_max)
+    wall = time.perf_counter() - t0
+    return grid.size, wall, result.iterations, peak_rss_mb() - rss_before, result.status, result.objective
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e4, 1e5, 1e6, 1e7])
+    parser.add_argument("--ecos-max", type=float, default=1e5, help="largest Npc solved with ECOS")
+    parser.add_argument("--highs-max", type=float, default=1e6, help="largest Npc solved with HiGHS (reference)")
+    parser.add_argument("--influence", choices=["dense", "operator"], default="dense")
+    args = parser.parse_args()
+
+    print(f"{'solver':<7} {'Npc':>9} {'wall (s)':>9} {'iters':>6} {'Δ peak RSS (MB)':>16} {'status':>9} "
+          f"{'objective':>14} {'rel. diff':>10}")
+    ctx = mp.get_context("spawn")
+    for size in args.sizes:
+        cases = ["ipm"]
+        if size <= args.ecos_max:
+            cases.insert(0, "ecos")
+        elif size <= args.highs_max:
+            cases.insert(0, "highs")
+        reference = None
+        for name in cases:
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                npc, wall, iters, rss, status, objective = pool.submit(run_case, name, int(size),
+                                                                       args.influence).result()
+            reference = objective if reference is None else reference
+            diff = abs(objective - reference) / abs(reference)
+            print(f"{name:<7} {npc:>9} {wall:>9.3f} {iters:>6} {rss:>16.1f} {status:>9} {objective:>14.8f} {diff:>10.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Full (unreduced) strand LP: cvxpy + ECOS vs direct scipy linprog/HiGHS.
+
+Each (backend, size) runs in a fresh process so that peak RSS is measured per solve.
+
+Run from the repository root:
+    python -m benchmarks.bench_lp_backends
+    python -m benchmarks.bench_lp_backends --sizes 1e4 1e5 1e6 --backends highs
+"""
+import argparse
+import multiprocessing as mp
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.default_slab import (
+    Ly, Lx, default_targets, e_design, n_cord_max, stress_per_tendon, t_slab, tendon_x_positions,
+)
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux reports KiB
+
+
+def run_case(backend_name, Npc):
+    from pt_slab.backends import get_backend
+    from pt_slab.geometry import control_grid
+    from pt_slab.influence import build_influence_matrix
+
+    grid = control_grid(Lx, Ly, Npc)
+    X, Y = grid.X, grid.Y
+    A = build_influence_matrix(X, Y, tendon_x_positions, Ly, e_design, t_slab)
+    load_vector = default_targets(Y)
+
+    backend = get_backend(backend_name)
+    rss_before = peak_rss_mb()
+    t0 = time.perf_counter()
+    result = backend.solve(A, load_vector, stress_per_tendon, n_cord_max)
+    wall = time.perf_counter() - t0
+    return len(X), wall, result.solve_time, peak_rss_mb() - rss_before, result.status, result.objective
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e4, 3e4, 1e5, 3e5])
+    parser.add_argument("--backends", nargs="+", default=["cvxpy", "highs"])
+    args = parser.parse_args()
+
+    print(f"{'backend':<8} {'Npc':>9} {'wall (s)':>9} {'solver (s)':>11} {'Δ peak RSS (MB)':>16} {'status':>9} {'objective':>11}")
+    ctx = mp.get_context("spawn")
+    for size in args.sizes:
+        for name in args.backends:
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                npc, wall, solver_time, rss, status, objective = pool.submit(run_case, name, int(size)).result()
+            print(f"{name:<8} {npc:>9} {wall:>9.3f} {solver_time:>11.3f} {rss:>16.1f} {status:>9} {objective:>11.6f}")
+
+
+if __name__ == "__main__":
+    main()
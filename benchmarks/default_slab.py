@@ -0,0 +1,17 @@
+"""Default slab of the prototype script (``SlabConfig()``), shared by the benchmarks."""
+from pt_slab.geometry import design_eccentricity, tendon_layout
+from pt_slab.loads import midspan_stress, parabolic_targets, strand_stress, total_load
+from pt_slab.optimizer import SlabConfig
+
+CONFIG = SlabConfig()
+Lx, Ly, t_slab = CONFIG.Lx, CONFIG.Ly, CONFIG.t_slab
+e_design = design_eccentricity(t_slab, CONFIG.cover, CONFIG.ecc_factor)[1]
+tendon_x_positions = tendon_layout(Lx, CONFIG.tendon_spacing)
+stress_per_tendon = strand_stress(CONFIG.cord_area, CONFIG.sigma_u, CONFIG.prestress_ratio, t_slab)  # MPa
+n_cord_max = CONFIG.n_cord_max
+sigma_max = midspan_stress(total_load(t_slab, CONFIG.q_live, CONFIG.gamma_concrete), Ly, t_slab)  # MPa
+
+
+def default_targets(Y):
+    """Parabolic target stresses of the default slab."""
+    return parabolic_targets(Y, sigma_max, Ly)
@@ -0,0 +1,87 @@
+"""Reusable building blocks for the post-tensioned slab optimizer prototype."""
+
+from .backends import (
+    BACKENDS,
+    CvxpyBackend,
+    HighsBackend,
+    InteriorPointBackend,
+    LPBackend,
+    SolveResult,
+    get_backend,
+)
+from .cache import InfluenceCache, influence_key
+from .editing import EditableInfluence
+from .fea_io import NodeStresses, read_node_stress_csv, read_node_stress_hdf5
+from .influence import (
+    build_influence_matrix,
+    build_sparse_influence_matrix,
+    eccentricity_factor,
+    lateral_influence,
+    tendon_influence_with_eccentricity,
+    tendon_profile,
+    truncation_radius,
+    truncation_stress_error,
+)
+from .interior_point import solve_interior_point, weighted_gram
+from .integer import remove_excess_strands, solve_integer_strands
+from .kernels import build_kernel_matrix, separable_kernel
+from .loads import ImportedTargets, ParabolicTargets, SuperposedTargets, TargetModel
+from .operators import InfluenceOperator
+from .optimizer import SharedInfluence, SlabConfig, SlabResult, optimize_slab
+from .parallel import SharedArray, build_influence_shared
+from .reduction import ProportionalGroups, proportional_groups, reduce_control_points
+from .sensitivity import Sensitivity
+from .solvers import StrandLP, solve_constraint_generation, stress_margin
+from .store import InfluenceStore
+from .verify import StressCheck, check_stress
+
+__all__ = [
+    "BACKENDS",
+    "CvxpyBackend",
+    "EditableInfluence",
+    "HighsBackend",
+    "ImportedTargets",
+    "InfluenceCache",
+    "InfluenceOperator",
+    "InfluenceStore",
+    "InteriorPointBackend",
+    "LPBackend",
+    "NodeStresses",
+    "ParabolicTargets",
+    "ProportionalGroups",
+    "Sensitivity",
+    "SharedArray",
+    "SharedInfluence",
+    "SlabConfig",
+    "SlabResult",
+    "SolveResult",
+    "StrandLP",
+    "StressCheck",
+    "SuperposedTargets",
+    "TargetModel",
+    "build_influence_matrix",
+    "build_influence_shared",
+    "build_kernel_matrix",
+    "build_sparse_influence_matrix",
+    "check_stress",
+    "eccentricity_factor",
+    "get_backend",
+    "influence_key",
+    "lateral_influence",
+    "optimize_slab",
+    "proportional_groups",
+    "read_node_stress_csv",
+    "read_node_stress_hdf5",
+    "reduce_control_points",
+    "remove_excess_strands",
+    "separable_kernel",
+    "solve_constraint_generation",
+    "solve_integer_strands",
+    "solve_interior_point",
+    "stress_margin",
+    "tendon_influence_with_eccentricity",
+    "tendon_profile",
+    "truncation_radius",
+    "truncation_stress_error",
+    "weighted_gram",
+]
@@ -0,0 +1,171 @@
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .operators import InfluenceOperator
+
+# ------------------------------------------------------
+# LP BACKENDS
+# ------------------------------------------------------
+
+#   minimize  sum(n)
+#   s.t.      A @ (n * stress_per_tendon) >= load_vector
+#             0 <= n <= n_cord_max
+# A backend solves this LP for the rows it is given; reduction and constraint
+# generation (pt_slab.reduction, pt_slab.solvers) decide which rows those are.
+# Statuses use the cvxpy vocabulary ("optimal", "infeasible", ...) for every backend.
+
+
+@dataclass
+class SolveResult:
+    x: np.ndarray            # continuous strands per tendon (None if not solved)
+    status: str
+    objective: float
+    solve_time: float = 0.0  # seconds spent inside the solver(s)
+    iterations: int = 1
+    active_rows: np.ndarray = field(default=None, repr=False)
+    mip_gap: float = None    # relative gap of integer solves
+    # LP sensitivities (None if the solver does not report them): duals[k] = ∂objective / ∂load of LP row k
+    # (of control point active_rows[k] when set), >= 0; upper_duals[t] / lower_duals[t] >= 0 are the
+    # multipliers of n[t] <= n_cord_max / n[t] >= 0, i.e. ∂objective / ∂n_cord_max[t] = -upper_duals[t]
+    duals: np.ndarray = field(default=None, repr=False)
+    upper_duals: np.ndarray = field(default=None, repr=False)
+    lower_duals: np.ndarray = field(default=None, repr=False)
+
+    @property
+    def optimal(self):
+        return self.status == "optimal"
+
+
+class LPBackend:
+    """Interface: ``solve(A, load_vector, stress_per_tendon, n_cord_max, x0=None) -> SolveResult``.
+
+    ``x0`` is a previous strand layout; backends that cannot warm start ignore it.
+    """
+
+    name = None
+
+    def solve(self, A, load_vector, stress_per_tendon, n_cord_max, x0=None):
+        raise NotImplementedError
+
+
+class CvxpyBackend(LPBackend):
+    """Model the LP with cvxpy and hand it to ``solver`` (ECOS by default)."""
+
+    name = "cvxpy"
+
+    def __init__(self, solver=None, **solve_kwargs):
+        import cvxpy as cp
+
+        self.solver = solver or cp.ECOS
+        self.solve_kwargs = solve_kwargs
+
+    def solve(self, A, load_vector, stress_per_tendon, n_cord_max, x0=None):
+        import cvxpy as cp
+
+        n = cp.Variable(A.shape[1])
+        if x0 is not None:
+            n.value = np.asarray(x0, dtype=float)
+        stress = n * stress_per_tendon
+        if isinstance(A, InfluenceOperator):
+            stress_constraints = A.cvxpy_constraints(stress, load_vector)
+        else:
+            stress_constraints = [A @ stress >= load_vector]
+        problem = cp.Problem(cp.Minimize(cp.sum(n)), stress_constraints + [n >= 0, n <= n_cord_max])
+
+        t0 = time.perf_counter()
+        problem.solve(solver=self.solver, warm_start=x0 is not None, **self.solve_kwargs)
+        solve_time = time.perf_counter() - t0
+        x = n.value if problem.status == cp.OPTIMAL else None
+        return SolveResult(x, problem.status, problem.value, solve_time, **cvxpy_duals(problem.constraints))
+
+
+class HighsBackend(LPBackend):
+    """Feed the matrix straight to ``scipy.optimize.linprog(method="highs")``, no modeling layer.
+
+    Dense and sparse ``A`` are passed as is; an ``InfluenceOperator`` is materialized,
+    so reduce it first (``reduce_control_points``) on large meshes.
+    """
+
+    name = "highs"
+    _STATUS = {0: "optimal", 1: "iteration_limit", 2: "infeasible", 3: "unbounded", 4: "numerical_error"}
+
+    def __init__(self, method="highs", presolve=False, **options):
+        # HiGHS presolve scans the many dense rows for redundancy and costs far more than the
+        # solve itself on this few-column LP (~20x at 1e5 rows); row reduction is done upstream
+        self.method = method
+        self.options = dict(options, presolve=presolve)
+
+    def solve(self, A, load_vector, stress_per_tendon, n_cord_max, x0=None):
+        from scipy.optimize import linprog
+
+        if isinstance(A, InfluenceOperator):
+            A = A.toarray()
+        A_ub = -stress_per_tendon * A
+        b_ub = -np.asarray(load_vector, dtype=float)
+
+        t0 = time.perf_counter()
+        res = linprog(np.ones(A.shape[1]), A_ub=A_ub, b_ub=b_ub, bounds=(0, n_cord_max),
+                      method=self.method, options=self.options)
+        solve_time = time.perf_counter() - t0
+        status = self._STATUS.get(res.status, "solver_error")
+        x = res.x if status == "optimal" else None
+        objective = res.fun if status == "optimal" else np.inf
+        duals = {}
+        if status == "optimal":
+            # linprog marginals are ∂objective / ∂b_ub (<= 0) with b_ub = -load_vector
+            duals = dict(duals=-res.ineqlin.marginals, upper_duals=-res.upper.marginals,
+                         lower_duals=res.lower.marginals)
+        return SolveResult(x, status, objective, solve_time, res.get("nit", 1), **duals)
+
+
+class InteriorPointBackend(LPBackend):
+    """Dedicated interior-point solver for few tendons and many rows (``pt_slab.interior_point``).
+
+    Works on the ``T × T`` normal equations, so ``A`` is never copied or canonicalized:
+    dense, memory-mapped, sparse and ``InfluenceOperator`` matrices are used as given.
+    """
+
+    name = "ipm"
+
+    def __init__(self, tol=1e-8, max_iter=100, block_rows=1 << 16):
+        self.tol = tol
+        self.max_iter = max_iter
+        self.block_rows = block_rows
+
+    def solve(self, A, load_vector, stress_per_tendon, n_cord_max, x0=None):
+        from .interior_point import solve_interior_point
+
+        return solve_interior_point(A, load_vector, stress_per_tendon, n_cord_max, tol=self.tol,
+                                    max_iter=self.max_iter, block_rows=self.block_rows)
+
+
+def cvxpy_duals(constraints):
+    """``SolveResult`` dual fields from ``[stress constraint(s)..., n >= 0, n <= n_cord_max]``.
+
+    The stress constraint is the last one before the bounds (``A @ stress >= load`` or the
+    lifted ``InfluenceOperator`` form, whose (Nx, Ny) dual is flattened in row order).
+    """
+    *_, stress, lower, upper = constraints
+    if stress.dual_value is None:
+        return {}
+    return dict(duals=np.ravel(stress.dual_value), upper_duals=np.asarray(upper.dual_value),
+                lower_duals=np.asarray(lower.dual_value))
+
+
+BACKENDS = {
+    CvxpyBackend.name: CvxpyBackend,
+    HighsBackend.name: HighsBackend,
+    InteriorPointBackend.name: InteriorPointBackend,
+}
+
+
+def get_backend(backend="cvxpy", **kwargs):
+    """Backend instance from a name in ``BACKENDS`` (instances are returned unchanged)."""
+    if isinstance(backend, LPBackend):
+        return backend
+    try:
+        return BACKENDS[backend](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown LP backend {backend!r}; choose from {sorted(BACKENDS)}") from None
@@ -0,0 +1,153 @@
+"""Batch optimization of many slab panels in a process pool.
+
+Usage (from the repository root):
+    python -m pt_slab.batch examples/panels.csv -o results.csv --workers 8 --cache .influence_cache
+
+The input table needs the columns ``name, Lx, Ly, t_slab, q_live, tendon_spacing``;
+any other column named after a ``SlabConfig`` field (e.g. ``n_cord_max``, ``Npc``,
+``lp_backend``) overrides the default for that panel.
+"""
+import argparse
+import csv
+import dataclasses
+import os
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .cache import InfluenceCache
+from .optimizer import SlabConfig, optimize_slab
+
+RESULT_FIELDS = [
+    "name", "status", "feasible", "n_tendons", "strands", "total_strands", "total_strands_full", "mass_kg",
+    "mass_full_kg", "steel_reduction_pct", "lp_rows", "lp_objective", "solve_time_s", "wall_time_s", "error",
+]
+
+# Batch runs favour throughput: direct HiGHS backend, greedy strand removal and a
+# single-threaded stress check (the process pool already uses every core)
+BATCH_DEFAULTS = dict(lp_backend="highs", integer_mode="greedy", check_workers=1)
+
+
+# ------------------------------------------------------
+# ONE PANEL
+# ------------------------------------------------------
+
+
+def optimize_panel(name="slab", cache=None, **params):
+    """Optimize the strands of one panel; returns a flat dict (one results-table row).
+
+    ``cache`` is an ``InfluenceCache`` shared by panels (and runs) with the same geometry.
+    """
+    t_start = time.perf_counter()
+    result = optimize_slab(SlabConfig(**{**BATCH_DEFAULTS, **params}), cache=cache)
+    return result_row(result, name, time.perf_counter() - t_start)
+
+
+def result_row(result, name="", wall_time=None):
+    """Flat results-table row (``RESULT_FIELDS``) of a ``SlabResult``."""
+    row = dict.fromkeys(RESULT_FIELDS, "")
+    row.update(name=name, status=result.status, feasible=result.feasible, n_tendons=len(result.tendon_x_positions))
+    if result.lp is not None:
+        row.update(lp_rows=result.lp_rows, solve_time_s=round(result.lp.solve_time, 4))
+    if result.x_opt is not None:
+        if result.n_violations:
+            row["status"] = "violated_after_rounding"
+        row.update(
+            strands=" ".join(map(str, result.x_opt)),
+            total_strands=result.total_strands_opt,
+            total_strands_full=result.total_strands_full,
+            mass_kg=round(result.mass_opt, 1),
+            mass_full_kg=round(result.mass_full, 1),
+            steel_reduction_pct=round(result.steel_reduction * 100, 1),
+            lp_objective=round(result.lp.objective, 4),
+        )
+    if wall_time is not None:
+        row["wall_time_s"] = round(wall_time, 4)
+    return row
+
+
+# ------------------------------------------------------
+# MANY PANELS
+# ------------------------------------------------------
+
+_CONFIG_FIELDS = {f.name: f for f in dataclasses.fields(SlabConfig)}
+_CONFIG_TYPES = typing.get_type_hints(SlabConfig)
+
+
+def _run_one(slab, cache=None):
+    try:
+        return optimize_panel(cache=cache, **slab)
+    except Exception as exc:  # one bad panel must not sink the batch
+        row = dict.fromkeys(RESULT_FIELDS, "")
+        row.update(name=slab.get("name", ""), status="error", error=f"{type(exc).__name__}: {exc}")
+        return row
+
+
+def run_batch(slabs, max_workers=None, chunksize=1, cache=None):
+    """Optimize every slab definition (dicts of ``optimize_panel`` keywords) in a process pool.
+
+    Returns the result rows in input order. ``max_workers=1`` runs in-process.
+    """
+    slabs = list(slabs)
+    run_one = partial(_run_one, cache=cache)
+    if max_workers == 1:
+        return [run_one(slab) for slab in slabs]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run_one, slabs, chunksize=chunksize))
+
+
+def read_slab_table(path):
+    """Slab definitions from a CSV file; numeric cells are converted, unknown columns rejected."""
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    slabs = []
+    for row in rows:
+        unknown = set(row) - set(_CONFIG_FIELDS) - {"name"}
+        if unknown:
+            raise ValueError(f"Unknown column(s) in {path}: {sorted(unknown)}")
+        slabs.append({key: _parse_cell(key, value) for key, value in row.items() if value not in ("", None)})
+    return slabs
+
+
+def write_results(rows, path, fields=RESULT_FIELDS):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _parse_cell(key, value):
+    if key == "name":
+        return value
+    # From the annotation, not the default: fields defaulting to None are still typed
+    kind = _CONFIG_TYPES[key]
+    kind = next((arg for arg in typing.get_args(kind) if arg is not type(None)), kind)  # Optional[int] -> int
+    if kind is bool:
+        return value.strip().lower() in ("1", "true", "yes")
+    if kind is str:
+        return value
+    number = float(value)
+    return int(number) if kind is int else number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Optimize PT strands for a table of slab panels.")
+    parser.add_argument("slabs", help="CSV with one slab panel per row")
+    parser.add_argument("-o", "--output", default="results.csv")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--cache", metavar="DIR", help="reuse influence matrices stored in DIR across panels and runs")
+    parser.add_argument("--cache-size", type=float, default=4.0, help="cache size limit in GB (default: 4)")
+    args = parser.parse_args(argv)
+
+    slabs = read_slab_table(args.slabs)
+    cache = InfluenceCache(args.cache, max_bytes=int(args.cache_size * 1e9)) if args.cache else None
+    t0 = time.perf_counter()
+    rows = run_batch(slabs, max_workers=args.workers, cache=cache)
+    write_results(rows, args.output)
+    n_ok = sum(row["feasible"] is True for row in rows)
+    print(f"{n_ok}/{len(rows)} panels optimized in {time.perf_counter() - t0:.1f} s → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+from .store import InfluenceStore, read_meta
+
+# ------------------------------------------------------
+# CONTENT-ADDRESSED INFLUENCE MATRIX CACHE
+# ------------------------------------------------------
+
+# The influence matrix only depends on the slab geometry, not on the loads or strand
+# properties, so load cases, strand sizes and solver settings of the same slab share it.
+# Each entry is an InfluenceStore named after a hash of the fields below; a hit is a
+# memory map of the stored files (no rebuild, no read). Entries are evicted least
+# recently used first (recency = mtime of meta.json, touched on every hit) once the
+# cache exceeds max_bytes.
+
+KEY_FIELDS = (
+    "Lx", "Ly", "t_slab", "cover", "ecc_factor", "tendon_spacing", "Npc", "sigma",
+    # representation of the same matrix
+    "influence_mode", "grid_dtype", "precision", "sparse_tol", "sparse_cutoff_sigmas",
+)
+_KEY_VERSION = 1
+
+
+def influence_key(config):
+    """Hex digest identifying the influence matrix of ``config`` (a ``SlabConfig``)."""
+    values = {}
+    for name in KEY_FIELDS:
+        value = getattr(config, name)
+        # 8 and 8.0 describe the same slab
+        values[name] = repr(float(value)) if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+    blob = json.dumps(dict(version=_KEY_VERSION, **values), sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()[:32]
+
+
+class InfluenceCache:
+    """Directory of influence stores keyed by ``influence_key``, bounded to ``max_bytes`` on disk."""
+
+    def __init__(self, root, max_bytes=4 << 30):
+        self.root = os.fspath(root)
+        self.max_bytes = max_bytes
+
+    def path(self, config):
+        return os.path.join(self.root, influence_key(config))
+
+    def get(self, config):
+        """Mapped ``InfluenceStore`` for ``config``, or ``None`` on a miss."""
+        path = self.path(config)
+        try:
+            os.utime(os.path.join(path, "meta.json"))
+            return InfluenceStore.open(path)
+        except FileNotFoundError:  # never stored, or evicted by another process
+            return None
+
+    def put(self, config, A, points, tendon_x_positions):
+        """Store ``A`` for ``config``, evict old entries if over budget; returns the mapped store.
+
+        The entry is written under a temporary name and renamed into place, so concurrent
+        workers putting the same key never see a partial entry (the first rename wins).
+        """
+        path = self.path(config)
+        os.makedirs(self.root, exist_ok=True)
+        tmp = os.path.join(self.root, f".tmp-{uuid.uuid4().hex}")
+        attrs = {name: getattr(config, name) for name in KEY_FIELDS}
+        InfluenceStore.save(tmp, A, points, tendon_x_positions, attrs=attrs)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not InfluenceStore.exists(path):
+                raise
+        self.evict(keep=path)
+        return InfluenceStore.open(path)
+
+    def entries(self):
+        """``(last use time, size in bytes, path)`` of every complete entry, oldest first."""
+        if not os.path.isdir(self.root):
+            return []
+        out = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.startswith("."):
+                continue
+            try:
+                read_meta(path)
+                used = os.path.getmtime(os.path.join(path, "meta.json"))
+                size = sum(entry.stat().st_size for entry in os.scandir(path))
+            except (OSError, ValueError):
+                continue
+            out.append((used, size, path))
+        return sorted(out)
+
+    @property
+    def nbytes(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep=None):
+        """Remove least recently used entries until the cache fits ``max_bytes`` (``keep`` is spared)."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,176 @@
+import numpy as np
+
+from .backends import get_backend
+from .influence import eccentricity_factor, lateral_influence
+from .operators import InfluenceOperator
+
+# ------------------------------------------------------
+# INCREMENTAL TENDON LAYOUT EDITS
+# ------------------------------------------------------
+
+# With the separable model every control point row is
+#   A[i] = E[i] * G[g(i)]
+# where g(i) is the index of X[i] among the distinct control point X values, G (n_x × T)
+# the Gaussian lateral term over those values and E the eccentricity factor of the point.
+# Moving, adding or removing a tendon changes one column of G (n_x values) and one column
+# of A (Npc values); E and g never change. Both G and A live in column-major buffers with
+# spare columns, so an edit writes one contiguous column in place and adding a tendon does
+# not reallocate.
+#
+# The same factors give the reduced LP directly: since E > 0,
+#   A[i] @ x >= b[i]  ⇔  G[g(i)] @ x >= b[i] / E[i]
+# so per distinct X only the largest b / E is kept (exactly the dominance reduction of
+# pt_slab.reduction, but independent of the tendon layout). Callers compute it once per
+# load vector with group_targets and pass it to every re-solve; each is an n_x × T LP.
+
+
+class EditableInfluence:
+    """Influence matrix whose tendons can be added, removed or moved without a rebuild.
+
+    ``mode="dense"`` keeps a dense ``A`` (any control points); ``mode="operator"`` keeps only
+    the separable factors (``points`` must be a ``ControlGrid``). ``A`` and
+    ``tendon_x_positions`` are views that reflect every edit; re-read them after editing.
+    """
+
+    def __init__(self, points, tendon_x_positions, Ly, e_design, t_slab, sigma=0.75, mode="dense",
+                 dtype=np.float64, spare=8):
+        if mode not in ("dense", "operator"):
+            raise ValueError(f"Unknown mode {mode!r}: tendon edits need a 'dense' or 'operator' influence")
+        self.mode = mode
+        self.sigma = sigma
+        self.points = points
+        self.dtype = np.dtype(dtype)
+        if mode == "operator":
+            self.x_values = np.asarray(points.x_control, dtype=self.dtype)
+            self.group = None
+            self.ecc = eccentricity_factor(points.y_control, Ly, e_design, t_slab, self.dtype)
+        else:
+            self.x_values, self.group = np.unique(np.asarray(points.X, dtype=self.dtype), return_inverse=True)
+            self.group = self.group.ravel()
+            self.ecc = eccentricity_factor(points.Y, Ly, e_design, t_slab, self.dtype)
+
+        tendon_x_positions = np.asarray(tendon_x_positions, dtype=float)
+        self.n_tendons = 0
+        self._x = np.empty(len(tendon_x_positions) + spare)
+        self._G = np.empty((len(self.x_values), len(self._x)), dtype=self.dtype, order="F")
+        self._A = np.empty((len(points.X), len(self._x)), dtype=self.dtype, order="F") if mode == "dense" else None
+        for x in tendon_x_positions:
+            self.add_tendon(x)
+
+    @classmethod
+    def from_result(cls, result, spare=8):
+        """Editor for the layout of a ``SlabResult`` (sparse results are edited in dense form).
+
+        The editor rebuilds the separable factors from ``result.config``; raises ``ValueError``
+        when ``result.A`` does not follow them (e.g. an FEA influence store or a custom kernel),
+        since edits would then silently switch to a different influence model.
+        """
+        c = result.config
+        mode = "operator" if isinstance(result.A, InfluenceOperator) else "dense"
+        editor = cls(result.grid, result.tendon_x_positions, c.Ly, result.e_design, c.t_slab, c.sigma, mode=mode,
+                     dtype=result.A.dtype, spare=spare)
+        editor._check_model(result.A)
+        return editor
+
+    # -- current layout -----------------------------------------------------
+
+    @property
+    def tendon_x_positions(self):
+        return self._x[:self.n_tendons]
+
+    @property
+    def lateral(self):
+        """Lateral factor ``G`` over the distinct control point X values, ``(n_x, T)``."""
+        return self._G[:, :self.n_tendons]
+
+    @property
+    def A(self):
+        """Current influence matrix (dense view or ``InfluenceOperator``), no copy."""
+        if self.mode == "operator":
+            return InfluenceOperator(self.lateral, self.ecc)
+        return self._A[:, :self.n_tendons]
+
+    # -- edits ----------------------------------------------------------------
+
+    def add_tendon(self, x):
+        """Append a tendon at ``x``; returns its index."""
+        t = self.n_tendons
+        if t == len(self._x):
+            self._grow()
+        self.n_tendons += 1
+        self.move_tendon(t, x)
+        return t
+
+    def move_tendon(self, t, x):
+        """Relocate tendon ``t`` to ``x`` (recomputes its column only)."""
+        t = self._check_index(t)
+        self._x[t] = x
+        self._G[:, t] = lateral_influence(self.x_values, [x], self.sigma, self.dtype)[:, 0]
+        if self._A is not None:
+            column = self._A[:, t]
+            np.take(self._G[:, t], self.group, out=column)
+            column *= self.ecc
+
+    def remove_tendon(self, t):
+        """Remove tendon ``t``; tendons after it shift down one index (order is kept)."""
+        t = self._check_index(t)
+        for buf in (self._G, self._A):
+            if buf is None:
+                continue
+            # column by column: each copy is contiguous and never overlaps
+            for k in range(t, self.n_tendons - 1):
+                buf[:, k] = buf[:, k + 1]
+        self._x[t:self.n_tendons - 1] = self._x[t + 1:self.n_tendons]
+        self.n_tendons -= 1
+
+    def _check_model(self, A, n_rows=64):
+        """Raise ``ValueError`` unless sampled rows of ``A`` match the separable factors."""
+        rows = np.unique(np.linspace(0, A.shape[0] - 1, n_rows).astype(int))
+        expected = np.asarray(self.A[rows], dtype=np.float64)
+        actual = A[rows]
+        actual = np.asarray(actual.toarray() if hasattr(actual, "toarray") else actual, dtype=np.float64)
+        if hasattr(A, "tocsr"):
+            expected[actual == 0] = 0   # entries dropped by the sparse truncation
+        tol = 64 * np.finfo(self.dtype).eps
+        if actual.shape != expected.shape or not np.allclose(actual, expected, rtol=tol,
+                                                             atol=tol * np.abs(expected).max(initial=0)):
+            raise ValueError("result.A does not follow the separable influence model of result.config "
+                             "(imported or custom kernel?); tendon edits would replace it")
+
+    def _check_index(self, t):
+        if not -self.n_tendons <= t < self.n_tendons:
+            raise IndexError(f"tendon index {t} out of range for {self.n_tendons} tendons")
+        return t % self.n_tendons
+
+    def _grow(self):
+        capacity = 2 * len(self._x) or 8
+        self._x = np.resize(self._x, capacity)
+        for name in ("_G", "_A"):
+            old = getattr(self, name)
+            if old is not None:
+                new = np.empty((old.shape[0], capacity), dtype=old.dtype, order="F")
+                new[:, :self.n_tendons] = old[:, :self.n_tendons]
+                setattr(self, name, new)
+
+    # -- reduced LP -----------------------------------------------------------
+
+    def group_targets(self, load_vector):
+        """Largest ``b / E`` per distinct X value; pass it to ``solve`` to reuse it across edits."""
+        b = np.asarray(load_vector, dtype=np.float64)
+        if self.mode == "operator":
+            targets = (b.reshape(len(self.x_values), len(self.ecc)) / self.ecc).max(axis=1)
+        else:
+            targets = np.full(len(self.x_values), -np.inf)
+            np.maximum.at(targets, self.group, b / self.ecc)
+        return targets
+
+    def solve(self, load_vector, stress_per_tendon, n_cord_max, backend="highs", x0=None, targets=None):
+        """Continuous strand LP for the current layout on the reduced rows (no rebuild of ``A``).
+
+        ``targets`` is ``group_targets(load_vector)`` computed beforehand (``load_vector`` is
+        then ignored); without it the targets are recomputed from ``load_vector`` on every call.
+        """
+        if targets is None:
+            targets = self.group_targets(load_vector)
+        keep = targets > 0  # G >= 0: rows with b <= 0 hold for any layout
+        return get_backend(backend).solve(self.lateral[keep], targets[keep], stress_per_tendon, n_cord_max, x0=x0)
@@ -0,0 +1,122 @@
+import csv
+from itertools import islice
+
+import numpy as np
+
+from .loads import ImportedTargets
+
+# ------------------------------------------------------
+# FEA NODE STRESS IMPORT (CSV / HDF5)
+# ------------------------------------------------------
+
+# Node stress tables exported by structural software (SAFE, SOFiSTiK, ...) can reach
+# several GB. They are read in chunks of rows straight into preallocated NumPy arrays,
+# so memory stays at the size of the result plus one chunk, whatever the file size.
+# Column / dataset names are given by the caller since every export names them differently.
+
+
+class NodeStresses:
+    """Node coordinates (m) and target stresses (MPa) read from an FEA export."""
+
+    def __init__(self, X, Y, values):
+        self.X = X
+        self.Y = Y
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def targets(self):
+        """Target model for ``optimize_slab(config, targets=...)`` (interpolated onto its control points)."""
+        return ImportedTargets(self.X, self.Y, self.values)
+
+
+def read_node_stress_csv(path, x_col="X", y_col="Y", stress_col="S", delimiter=None, decimal=".", scale=1.0,
+                         chunk_rows=1 << 16, dtype=np.float64, encoding="utf-8"):
+    """Stream a delimited node stress table into ``NodeStresses``.
+
+    Columns are matched by header name (case-insensitive). ``delimiter`` is detected
+    from the header when not given; ``decimal=","`` handles locales with decimal commas
+    (use a ``;`` or tab delimiter then). A units row right below the header is skipped.
+    ``scale`` converts the stress unit (e.g. ``1e-3`` for kN/m² → MPa).
+    """
+    capacity = _count_lines(path)
+    out = np.empty((3, capacity), dtype=dtype)
+
+    with open(path, newline="", encoding=encoding) as f:
+        header = f.readline()
+        if delimiter is None:
+            delimiter = csv.Sniffer().sniff(header, delimiters=",;\t|").delimiter
+        names = [name.strip().strip('"').lower() for name in header.split(delimiter)]
+        try:
+            usecols = [names.index(col.lower()) for col in (x_col, y_col, stress_col)]
+        except ValueError:
+            raise ValueError(f"{path}: columns {x_col!r}, {y_col!r}, {stress_col!r} not all in header {names}") from None
+
+        n = 0
+        first = True
+        while True:
+            lines = list(islice(f, chunk_rows))
+            if not lines:
+                break
+            if first:
+                first = False
+                if not _is_numeric_row(lines[0], delimiter, decimal, usecols):
+                    lines = lines[1:]  # units row
+            if decimal != ".":
+                lines = [line.replace(decimal, ".") for line in lines]
+            block = np.loadtxt(lines, delimiter=delimiter, usecols=usecols, dtype=dtype, ndmin=2, quotechar='"')
+            out[:, n:n + len(block)] = block.T
+            n += len(block)
+
+    X, Y, values = out[0, :n], out[1, :n], out[2, :n]
+    if scale != 1.0:
+        values *= scale
+    return NodeStresses(X, Y, values)
+
+
+def read_node_stress_hdf5(path, x="X", y="Y", stress="S", scale=1.0, chunk_rows=1 << 20, dtype=np.float64):
+    """Read 1-D coordinate and stress datasets of an HDF5 file into ``NodeStresses``.
+
+    Each dataset is copied slab by slab into its preallocated output array
+    (``read_direct``), without intermediate copies. Requires ``h5py``.
+    """
+    try:
+        import h5py
+    except ImportError as exc:
+        raise ImportError("Reading HDF5 stress exports requires h5py (pip install h5py)") from exc
+
+    with h5py.File(path, "r") as f:
+        datasets = [f[x], f[y], f[stress]]
+        n = len(datasets[0])
+        if any(d.shape != (n,) for d in datasets):
+            raise ValueError(f"{path}: datasets {x!r}, {y!r}, {stress!r} must be 1-D of the same length")
+        arrays = [np.empty(n, dtype=dtype) for _ in datasets]
+        for dataset, arr in zip(datasets, arrays):
+            for start in range(0, n, chunk_rows):
+                sel = np.s_[start:min(start + chunk_rows, n)]
+                dataset.read_direct(arr, source_sel=sel, dest_sel=sel)
+
+    X, Y, values = arrays
+    if scale != 1.0:
+        values *= scale
+    return NodeStresses(X, Y, values)
+
+
+def _count_lines(path, block_size=1 << 24):
+    """Upper bound of the number of data rows: newlines in the file (read in binary blocks)."""
+    count = 0
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            count += block.count(b"\n")
+    return count + 1
+
+
+def _is_numeric_row(line, delimiter, decimal, usecols):
+    fields = line.split(delimiter)
+    try:
+        for col in usecols:
+            float(fields[col].strip().strip('"').replace(decimal, "."))
+    except (ValueError, IndexError):
+        return False
+    return True
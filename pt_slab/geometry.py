@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+
+# ------------------------------------------------------
+# GEOMETRY: TENDONS, ECCENTRICITY, CONTROL POINTS
+# ------------------------------------------------------
+
+
+def tendon_layout(Lx, tendon_spacing, edge=0.5):
+    """Uniformly spaced tendon x positions, ``edge`` from each slab edge."""
+    return np.arange(edge, Lx - edge + 1e-6, tendon_spacing)
+
+
+def design_eccentricity(t_slab, cover, ecc_factor=1.0):
+    """``(e_max, e_design)``: maximum usable and design eccentricity of the parabolic profile (m)."""
+    e_max = t_slab / 2 - cover
+    return e_max, ecc_factor * e_max
+
+
+def grid_size(Lx, Ly, Npc):
+    """``(Nx, Ny)``: odd grid counts with about ``Npc`` points, following the slab aspect ratio."""
+    Ny = int(math.sqrt(Npc / (Lx / Ly)))
+    if Ny % 2 == 0:
+        Ny += 1
+    Nx = int(Npc / Ny)
+    if Nx % 2 == 0:
+        Nx += 1
+    return Nx, Ny
+
+
+class ControlPoints:
+    """Arbitrary control points (e.g. FEA nodes) as contiguous 1-D coordinate arrays."""
+
+    def __init__(self, X, Y, dtype=np.float64):
+        self.X = np.ascontiguousarray(X, dtype=dtype)
+        self.Y = np.ascontiguousarray(Y, dtype=dtype)
+        if self.X.shape != self.Y.shape or self.X.ndim != 1:
+            raise ValueError("X and Y must be 1-D arrays of the same length")
+
+    @property
+    def size(self):
+        return len(self.X)
+
+
+class ControlGrid(ControlPoints):
+    """Regular control point grid; flattened points are ordered x outer, y inner.
+
+    ``X`` and ``Y`` are contiguous 1-D arrays of length ``Nx * Ny`` (no per-point Python objects).
+    """
+
+    def __init__(self, x_control, y_control, dtype=np.float64):
+        self.x_control = np.asarray(x_control, dtype=dtype)
+        self.y_control = np.asarray(y_control, dtype=dtype)
+        Xg, Yg = np.meshgrid(self.x_control, self.y_control, indexing="ij")
+        self.X = Xg.ravel()
+        self.Y = Yg.ravel()
+
+    @property
+    def shape(self):
+        return len(self.x_control), len(self.y_control)
+
+
+def control_grid(Lx, Ly, Npc, edge=0.5, dtype=np.float64):
+    """Control points (can be replaced by an FEA mesh) covering the slab ``edge`` from its borders.
+
+    ``dtype=np.float32`` halves the coordinate memory on very fine grids.
+    """
+    Nx, Ny = grid_size(Lx, Ly, Npc)
+    return ControlGrid(np.linspace(edge, Lx - edge, Nx), np.linspace(edge, Ly - edge, Ny), dtype)
@@ -0,0 +1,125 @@
+import numpy as np
+
+# ------------------------------------------------------
+# INFLUENCE MODEL
+# ------------------------------------------------------
+
+# The simplified influence of a tendon on a control point is separable:
+#   A[i, t] = exp(-dx² / 2σ²) * (1 + e(y) / (t_slab / 2))
+# i.e. a Gaussian lateral term over the tendon positions times an
+# eccentricity term over the control point Y coordinate.
+
+
+def tendon_profile(y, Ly, e0):
+    return 4 * e0 * (y / Ly) * (1 - y / Ly)
+
+
+def tendon_influence_with_eccentricity(xc, x_cp, y_cp, Ly, e_design, t_slab, sigma=0.75):
+    """Scalar reference kernel: influence of the tendon at ``xc`` on one control point."""
+    dx = abs(x_cp - xc)
+    infl_base = np.exp(- (dx ** 2) / (2 * sigma ** 2))
+    ecc = tendon_profile(y_cp, Ly, e_design)
+    return infl_base * (1 + ecc / (t_slab / 2))
+
+
+def lateral_influence(x_cp, tendon_x_positions, sigma=0.75, dtype=np.float64):
+    """Gaussian lateral term, shape ``(len(x_cp), len(tendon_x_positions))``."""
+    x_cp = np.asarray(x_cp, dtype=dtype)
+    x_t = np.asarray(tendon_x_positions, dtype=dtype)
+    out = np.subtract.outer(x_cp, x_t)
+    np.square(out, out=out)
+    out *= -1.0 / (2 * sigma ** 2)
+    np.exp(out, out=out)
+    return out
+
+
+def eccentricity_factor(y_cp, Ly, e_design, t_slab, dtype=np.float64):
+    """Eccentricity amplification ``1 + e(y) / (t_slab / 2)`` per control point."""
+    y_cp = np.asarray(y_cp, dtype=dtype)
+    return 1 + tendon_profile(y_cp, Ly, e_design) / (t_slab / 2)
+
+
+def build_influence_matrix(X, Y, tendon_x_positions, Ly, e_design, t_slab, sigma=0.75, dtype=np.float64):
+    """Dense influence matrix ``A`` of shape ``(len(X), len(tendon_x_positions))``.
+
+    Broadcast equivalent of calling ``tendon_influence_with_eccentricity`` for
+    every (control point, tendon) pair, without the Python double loop.
+    """
+    A = lateral_influence(X, tendon_x_positions, sigma, dtype)
+    A *= eccentricity_factor(Y, Ly, e_design, t_slab, dtype)[:, None]
+    return A
+
+
+# ------------------------------------------------------
+# SPARSE (TRUNCATED) INFLUENCE MATRIX
+# ------------------------------------------------------
+
+# The Gaussian lateral term is numerically zero a few σ away from the tendon.
+# Since every coefficient is non-negative, dropping the tail can only under-estimate
+# the induced stress, so a layout that passes with the truncated A also passes with the full A.
+
+
+def truncation_radius(sigma, tol, ecc_max=1.0):
+    """Distance beyond which ``ecc_max * exp(-dx² / 2σ²)`` falls below ``tol``."""
+    if tol <= 0:
+        return np.inf
+    return sigma * np.sqrt(2 * np.log(ecc_max / tol)) if tol < ecc_max else 0.0
+
+
+def build_sparse_influence_matrix(X, Y, tendon_x_positions, Ly, e_design, t_slab, sigma=0.75,
+                                  tol=1e-6, cutoff_sigmas=None, dtype=np.float64):
+    """CSR influence matrix keeping only entries ``>= tol`` (or within ``cutoff_sigmas``·σ).
+
+    Row ``i`` only touches the tendons whose position lies within the cutoff
+    radius of ``X[i]``, so neither time nor memory scale with the dense size.
+    """
+    import scipy.sparse as sp
+
+    X = np.asarray(X, dtype=dtype)
+    E = eccentricity_factor(Y, Ly, e_design, t_slab, dtype)
+    x_t = np.asarray(tendon_x_positions, dtype=dtype)
+    order = np.argsort(x_t, kind="stable")
+    x_sorted = x_t[order]
+
+    if cutoff_sigmas is not None:
+        radius = cutoff_sigmas * sigma
+    else:
+        radius = truncation_radius(sigma, tol, float(E.max(initial=1.0)))
+
+    lo = np.searchsorted(x_sorted, X - radius, side="left")
+    hi = np.searchsorted(x_sorted, X + radius, side="right")
+    counts = hi - lo
+    indptr = np.zeros(len(X) + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+
+    rows = np.repeat(np.arange(len(X)), counts)
+    cols = lo[rows] + (np.arange(indptr[-1]) - indptr[rows])
+    dx = X[rows] - x_sorted[cols]
+    data = np.exp(-(dx ** 2) / (2 * sigma ** 2)) * E[rows]
+
+    if cutoff_sigmas is None and tol > 0:
+        keep = data >= tol
+        rows, cols, data = rows[keep], cols[keep], data[keep]
+        indptr = np.zeros(len(X) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(X)), out=indptr[1:])
+
+    A = sp.csr_matrix((data.astype(dtype, copy=False), order[cols], indptr), shape=(len(X), len(x_t)))
+    A.sort_indices()
+    return A
+
+
+def truncation_stress_error(A_sparse, X, Y, tendon_x_positions, Ly, e_design, t_slab, x, sigma=0.75,
+                            chunk_size=1 << 16):
+    """Max |(A_full - A_sparse) @ x| over all control points, evaluated in row chunks.
+
+    With ``x`` set to the fully stressed layout (all tendons at ``n_cord_max``)
+    this bounds the stress error of any feasible layout, as all coefficients are >= 0.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    err = 0.0
+    for start in range(0, len(X), chunk_size):
+        stop = min(start + chunk_size, len(X))
+        exact = build_influence_matrix(X[start:stop], Y[start:stop], tendon_x_positions,
+                                       Ly, e_design, t_slab, sigma) @ x
+        err = max(err, float(np.abs(exact - A_sparse[start:stop] @ x).max(initial=0.0)))
+    return err
@@ -0,0 +1,189 @@
+import time
+
+import numpy as np
+
+from .backends import SolveResult
+from .operators import InfluenceOperator
+from .verify import induced_stress
+
+# ------------------------------------------------------
+# INTEGER STRAND OPTIMIZATION (MILP)
+# ------------------------------------------------------
+
+# Same LP as pt_slab.backends but with integer strand counts. Rounding the LP solution
+# up is always feasible; greedy strand removal from there (remove_excess_strands below,
+# milliseconds) seeds the branch and bound as an incumbent, so the MILP never returns
+# more strands than greedy. Since the objective is a sum of integers, ceil(LP optimum)
+# is also a valid lower bound. A time limit and a relative MIP gap keep the solve
+# interactive on 50+ tendons; a time-limited solve is reported as "optimal_inaccurate".
+# HiGHS is used through highspy when available (incumbent seeding); otherwise through
+# scipy.optimize.milp, which cannot take a starting solution (the better of its result
+# and the incumbent is returned).
+
+
+def solve_integer_strands(A, load_vector, stress_per_tendon, n_cord_max, x_lp=None, time_limit=10.0,
+                          mip_gap=1e-3):
+    """Integer strands per tendon minimizing the total, subject to the stress constraints.
+
+    ``x_lp`` is the continuous LP solution, used for the incumbent (``ceil(x_lp)`` after
+    greedy strand removal) and the bound ``sum(n) >= ceil(sum(x_lp))``. Returns a
+    ``SolveResult`` whose ``x`` is an int array; status is ``"optimal"`` within ``mip_gap``
+    or ``"optimal_inaccurate"`` when the time limit stopped the search with a feasible
+    layout (``mip_gap`` then measured against the LP bound).
+    """
+    if isinstance(A, InfluenceOperator):
+        A = A.toarray()
+    load_vector = np.asarray(load_vector, dtype=float)
+    n_tendons = A.shape[1]
+
+    incumbent, lower_bound = None, 0.0
+    if x_lp is not None:
+        x_lp = np.asarray(x_lp, dtype=float)
+        incumbent = np.minimum(np.ceil(x_lp - 1e-9), n_cord_max)
+        if np.any(induced_stress(A, incumbent, stress_per_tendon) < load_vector):
+            incumbent = None
+        else:
+            incumbent = remove_excess_strands(A, load_vector, incumbent, stress_per_tendon).astype(float)
+        lower_bound = np.ceil(x_lp.sum() - 1e-6)
+
+    try:
+        import highspy
+    except ImportError:
+        highspy = None
+    solve = _solve_highspy if highspy is not None else _solve_scipy
+    t0 = time.perf_counter()
+    x, status, gap = solve(A * stress_per_tendon, load_vector, n_cord_max, n_tendons, incumbent, lower_bound,
+                           time_limit, mip_gap)
+    solve_time = time.perf_counter() - t0
+
+    if incumbent is not None and (x is None or np.rint(x).sum() > incumbent.sum()):
+        x = incumbent
+        status = "optimal" if incumbent.sum() <= lower_bound else "optimal_inaccurate"
+        gap = np.inf
+    if x is None:
+        return SolveResult(None, status, np.inf, solve_time, mip_gap=gap)
+    x = np.rint(x).astype(int)
+    if not np.isfinite(gap):
+        gap = (x.sum() - lower_bound) / max(x.sum(), 1)
+    return SolveResult(x, status, float(x.sum()), solve_time, mip_gap=gap)
+
+
+def _constraint_matrix(A_scaled):
+    """Stress rows plus the all-ones row of the objective cut, as one sparse matrix."""
+    import scipy.sparse as sp
+
+    return sp.vstack([sp.csr_matrix(A_scaled), sp.csr_matrix(np.ones((1, A_scaled.shape[1])))])
+
+
+def _solve_highspy(A_scaled, load_vector, n_cord_max, n_tendons, incumbent, lower_bound, time_limit, mip_gap):
+    import highspy
+
+    M = _constraint_matrix(A_scaled).tocsc()
+    lp = highspy.HighsLp()
+    lp.num_col_, lp.num_row_ = n_tendons, M.shape[0]
+    lp.col_cost_ = np.ones(n_tendons)
+    lp.col_lower_ = np.zeros(n_tendons)
+    lp.col_upper_ = np.full(n_tendons, float(n_cord_max))
+    lp.row_lower_ = np.append(load_vector, lower_bound)
+    lp.row_upper_ = np.full(M.shape[0], highspy.kHighsInf)
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    lp.a_matrix_.start_ = M.indptr
+    lp.a_matrix_.index_ = M.indices
+    lp.a_matrix_.value_ = M.data
+    lp.integrality_ = [highspy.HighsVarType.kInteger] * n_tendons
+
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    h.setOptionValue("time_limit", float(time_limit))
+    h.setOptionValue("mip_rel_gap", float(mip_gap))
+    h.passModel(lp)
+    if incumbent is not None:
+        solution = highspy.HighsSolution()
+        solution.col_value = list(incumbent)
+        h.setSolution(solution)
+    h.run()
+
+    model_status = h.getModelStatus()
+    info = h.getInfo()
+    has_solution = info.primal_solution_status == highspy.SolutionStatus.kSolutionStatusFeasible
+    if model_status == highspy.HighsModelStatus.kOptimal:
+        status = "optimal"
+    elif model_status == highspy.HighsModelStatus.kInfeasible:
+        status = "infeasible"
+    elif has_solution:
+        status = "optimal_inaccurate"
+    else:
+        status = "solver_error"
+    x = np.array(h.getSolution().col_value) if has_solution else None
+    return x, status, info.mip_gap if has_solution else np.inf
+
+
+def _solve_scipy(A_scaled, load_vector, n_cord_max, n_tendons, incumbent, lower_bound, time_limit, mip_gap):
+    from scipy.optimize import Bounds, LinearConstraint, milp
+
+    M = _constraint_matrix(A_scaled)
+    res = milp(np.ones(n_tendons), integrality=np.ones(n_tendons),
+               bounds=Bounds(0, n_cord_max),
+               constraints=LinearConstraint(M, np.append(load_vector, lower_bound), np.inf),
+               options={"time_limit": time_limit, "mip_rel_gap": mip_gap, "presolve": False})
+    if res.status == 0:
+        return res.x, "optimal", res.get("mip_gap", 0.0)
+    if res.status == 2:
+        return None, "infeasible", np.inf
+    if res.x is not None:
+        return res.x, "optimal_inaccurate", res.get("mip_gap", np.inf)
+    # Time limit without an improving solution: fall back to the (feasible) rounded LP layout
+    if incumbent is not None:
+        return incumbent, "optimal_inaccurate", np.inf
+    return None, "solver_error", np.inf
+
+
+# ------------------------------------------------------
+# GREEDY STRAND REMOVAL (CHEAP ALTERNATIVE TO THE MILP)
+# ------------------------------------------------------
+
+# Starting from a feasible integer layout (typically ceil of the LP), try removing one
+# strand at a time. The stress slack A @ (x * s) - b is kept up to date with a single
+# column of A, so each trial costs O(Npc) (O(nnz of the column) for sparse A) instead of
+# a full A @ x.
+
+
+def remove_excess_strands(A, load_vector, x, stress_per_tendon, tol=0.0):
+    """Greedily decrement strands while every stress constraint stays satisfied.
+
+    Tendons with the most strands are tried first; passes repeat until no strand can
+    be removed. Returns the new integer layout (``x`` itself is not modified).
+    """
+    x = np.array(x, dtype=int)
+    load_vector = np.asarray(load_vector, dtype=float)
+    slack = induced_stress(A, x, stress_per_tendon) - load_vector
+    if np.any(slack < -tol):
+        raise ValueError("Starting layout violates the stress constraints")
+
+    columns = _ColumnReader(A)
+    removed = True
+    while removed:
+        removed = False
+        for t in np.argsort(-x, kind="stable"):
+            rows, delta = columns.scaled(t, stress_per_tendon)
+            while x[t] > 0 and np.all(slack[rows] - delta >= -tol):
+                slack[rows] -= delta
+                x[t] -= 1
+                removed = True
+    return x
+
+
+class _ColumnReader:
+    """Non-zero rows and values of one column of a dense, sparse or operator ``A``."""
+
+    def __init__(self, A):
+        self.A = A.tocsc() if hasattr(A, "tocsc") else A
+
+    def scaled(self, t, factor):
+        A = self.A
+        if isinstance(A, InfluenceOperator):
+            return slice(None), A.column(t) * factor
+        if hasattr(A, "indptr"):
+            start, stop = A.indptr[t], A.indptr[t + 1]
+            return A.indices[start:stop], A.data[start:stop] * factor
+        return slice(None), A[:, t] * factor
@@ -0,0 +1,154 @@
+import time
+
+import numpy as np
+
+from .backends import SolveResult
+from .operators import InfluenceOperator
+from .verify import induced_stress
+
+# ------------------------------------------------------
+# LOW-DIMENSIONAL INTERIOR-POINT LP (FEW TENDONS, MANY CONTROL POINTS)
+# ------------------------------------------------------
+
+# The strand LP has T variables (one per tendon, rarely more than ~200) and up to
+# millions of stress rows. Written as  min 1ᵀn  s.t.  G n <= h  with
+#   G = [-s·A; -I; I],  h = [-b; 0; n_cord_max]
+# a primal-dual (Mehrotra predictor-corrector) interior-point method only ever solves
+#   (s² · Aᵀ W A + W_lower + W_upper) Δn = rhs
+# a dense T × T system: W = z / slack is diagonal, so the per-iteration work is one
+# blocked Gram product Aᵀ W A (O(Npc·T²), no Npc × Npc or Npc × T temporaries) plus a few
+# matrix-vector products over A. No modeling layer, no canonicalization, and A can be
+# dense, memory-mapped, scipy sparse or an InfluenceOperator (Gram in closed form).
+
+
+def weighted_gram(A, w, block_rows=1 << 16):
+    """``A.T @ diag(w) @ A`` as a dense ``(T, T)`` array, accumulated in float64."""
+    if isinstance(A, InfluenceOperator):
+        # A = kron(G, E[:, None]):  Aᵀ W A = Gᵀ diag(W_grid @ E²) G
+        d = np.asarray(w).reshape(A.grid_shape) @ np.square(A.ecc, dtype=np.float64)
+        G = A.lateral.astype(np.float64, copy=False)
+        return G.T @ (G * d[:, None])
+    if hasattr(A, "tocsr"):
+        return np.asarray((A.T @ A.multiply(np.asarray(w)[:, None]).tocsr()).todense())
+    T = A.shape[1]
+    out = np.zeros((T, T))
+    for start in range(0, A.shape[0], block_rows):
+        block = np.asarray(A[start:start + block_rows], dtype=np.float64)
+        out += block.T @ (block * w[start:start + block_rows, None])
+    return out
+
+
+def _rmatvec(A, v, block_rows=1 << 16):
+    """``A.T @ v`` in float64 (float32 row blocks upcast one at a time)."""
+    if isinstance(A, InfluenceOperator):
+        return A.rmatvec(v)
+    if np.dtype(A.dtype) == np.float64:
+        return np.asarray(A.T @ v).ravel()
+    out = np.zeros(A.shape[1])
+    for start in range(0, A.shape[0], block_rows):
+        out += np.asarray(A[start:start + block_rows].astype(np.float64).T @ v[start:start + block_rows]).ravel()
+    return out
+
+
+def _max_step(v, dv):
+    """Largest ``alpha <= 1`` keeping ``v + alpha * dv >= 0``."""
+    neg = dv < 0
+    if not neg.any():
+        return 1.0
+    return min(1.0, float(np.min(-v[neg] / dv[neg])))
+
+
+def solve_interior_point(A, load_vector, stress_per_tendon, n_cord_max, tol=1e-8, max_iter=100,
+                         block_rows=1 << 16):
+    """Strand LP by a primal-dual interior-point method on the ``T × T`` normal equations.
+
+    Returns a ``SolveResult`` with duals (see ``pt_slab.backends``); ``status`` is
+    ``"optimal"``, ``"infeasible"`` (dual certificate found) or ``"max_iter_reached"``.
+    """
+    t0 = time.perf_counter()
+    b = np.asarray(load_vector, dtype=np.float64)
+    m, T = A.shape
+    sp = float(stress_per_tendon)
+    u = float(n_cord_max)
+
+    def stress(x):
+        return induced_stress(A, x, sp)
+
+    # Start in the middle of the box; slacks shifted to be positive, unit duals
+    x = np.full(T, u / 2)
+    Ax = stress(x)
+    s1 = np.maximum(Ax - b, 1.0)
+    s2, s3 = x.copy(), u - x
+    z1, z2, z3 = np.ones(m), np.ones(T), np.ones(T)
+    n_pairs = m + 2 * T
+    norm_h = 1 + max(np.abs(b).max(initial=0), u)
+
+    status = "max_iter_reached"
+    for iteration in range(1, max_iter + 1):
+        # Residuals of G x + s = h and c + Gᵀ z = 0
+        rp1 = s1 - (Ax - b)
+        rp2 = s2 - x
+        rp3 = s3 + x - u
+        Atz = sp * _rmatvec(A, z1)
+        rd = 1.0 - Atz - z2 + z3
+        gap = z1 @ s1 + z2 @ s2 + z3 @ s3
+        mu = gap / n_pairs
+        objective = x.sum()
+
+        pres = max(np.abs(rp1).max(initial=0), np.abs(rp2).max(), np.abs(rp3).max()) / norm_h
+        dres = np.abs(rd).max()
+        if pres < tol and dres < tol and gap / (1 + abs(objective)) < tol:
+            status = "optimal"
+            break
+        # Farkas certificate: z >= 0 with Gᵀ z ≈ 0 and hᵀ z < 0
+        hz = -(b @ z1) + u * z3.sum()
+        if hz < 0 and np.abs(Atz + z2 - z3).max() <= tol * -hz:
+            status = "infeasible"
+            break
+
+        W1, W2, W3 = z1 / s1, z2 / s2, z3 / s3
+        H = sp * sp * weighted_gram(A, W1, block_rows)
+        H[np.diag_indices(T)] += W2 + W3
+
+        def newton(rc1, rc2, rc3):
+            # v = W rp - rc / s per block;  H Δx = -rd - Gᵀ v  with  Gᵀ v = -s Aᵀ v1 - v2 + v3
+            v1 = W1 * rp1 - rc1 / s1
+            v2 = W2 * rp2 - rc2 / s2
+            v3 = W3 * rp3 - rc3 / s3
+            rhs = -rd + sp * _rmatvec(A, v1) + v2 - v3
+            dx = np.linalg.solve(H, rhs)
+            dAx = stress(dx)
+            dz1 = W1 * (rp1 - dAx) - rc1 / s1
+            dz2 = W2 * (rp2 - dx) - rc2 / s2
+            dz3 = W3 * (rp3 + dx) - rc3 / s3
+            ds1 = -(rc1 + s1 * dz1) / z1
+            ds2 = -(rc2 + s2 * dz2) / z2
+            ds3 = -(rc3 + s3 * dz3) / z3
+            return dx, dAx, (ds1, ds2, ds3), (dz1, dz2, dz3)
+
+        def steps(ds, dz):
+            alpha_p = min(_max_step(v, dv) for v, dv in zip((s1, s2, s3), ds))
+            alpha_d = min(_max_step(v, dv) for v, dv in zip((z1, z2, z3), dz))
+            return alpha_p, alpha_d
+
+        # Predictor (affine scaling), then centering + second-order corrector
+        _, _, ds, dz = newton(s1 * z1, s2 * z2, s3 * z3)
+        alpha_p, alpha_d = steps(ds, dz)
+        mu_aff = sum((s + alpha_p * d_s) @ (z + alpha_d * d_z)
+                     for s, d_s, z, d_z in zip((s1, s2, s3), ds, (z1, z2, z3), dz)) / n_pairs
+        sigma = (mu_aff / mu) ** 3
+        dx, dAx, ds, dz = newton(*(s * z + d_s * d_z - sigma * mu
+                                   for s, d_s, z, d_z in zip((s1, s2, s3), ds, (z1, z2, z3), dz)))
+        alpha_p, alpha_d = steps(ds, dz)
+        alpha_p, alpha_d = 0.99 * alpha_p, 0.99 * alpha_d
+
+        x = x + alpha_p * dx
+        Ax = Ax + alpha_p * dAx
+        s1, s2, s3 = (s + alpha_p * d for s, d in zip((s1, s2, s3), ds))
+        z1, z2, z3 = (z + alpha_d * d for z, d in zip((z1, z2, z3), dz))
+
+    solve_time = time.perf_counter() - t0
+    if status != "optimal":
+        return SolveResult(None, status, np.inf, solve_time, iteration)
+    return SolveResult(np.clip(x, 0, u), status, float(x.sum()), solve_time, iteration,
+                       duals=z1, upper_duals=z3, lower_duals=z2)
@@ -0,0 +1,88 @@
+import numpy as np
+
+# ------------------------------------------------------
+# GENERAL (NON-SEPARABLE) INFLUENCE KERNELS
+# ------------------------------------------------------
+
+# Imported or calibrated influence models need not factor into a lateral term times an
+# eccentricity term. A kernel is any function
+#
+#   kernel(x_cp, y_cp, x_tendon, params) -> influence
+#
+# x_cp, y_cp    control point coordinates (m)
+# x_tendon      tendon position (m)
+# params        1-D float64 array of model constants (e.g. Ly, e_design, t_slab, sigma)
+#
+# written with arithmetic, comparisons through np.where / np.minimum / np.maximum, and
+# NumPy ufuncs (np.exp, np.sqrt, abs, ...) only. The same function is then evaluated
+#   - by Numba (optional dependency) on scalars, compiled together with a row loop that
+#     runs over control points with prange (one thread per core), or
+#   - by the NumPy fallback on broadcast (rows, 1) × (1, T) blocks of control points.
+# A[i, t] = kernel(X[i], Y[i], tendon_x_positions[t], params).
+
+
+def separable_kernel(x_cp, y_cp, x_tendon, params):
+    """The default influence model as a kernel; ``params = (Ly, e_design, t_slab, sigma)``."""
+    Ly, e_design, t_slab, sigma = params[0], params[1], params[2], params[3]
+    dx = x_cp - x_tendon
+    ecc = 4 * e_design * (y_cp / Ly) * (1 - y_cp / Ly)
+    return np.exp(-(dx * dx) / (2 * sigma * sigma)) * (1 + ecc / (t_slab / 2))
+
+
+def numba_available():
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_NUMBA_FILLERS = {}
+
+
+def _numba_filler(kernel):
+    """Compiled ``fill(X, Y, x_t, params, out)`` for ``kernel`` (compiled once per kernel)."""
+    if kernel not in _NUMBA_FILLERS:
+        import numba
+
+        k = kernel if isinstance(kernel, numba.core.dispatcher.Dispatcher) else numba.njit(kernel)
+
+        @numba.njit(parallel=True)
+        def fill(X, Y, x_t, params, out):
+            for i in numba.prange(X.shape[0]):
+                for t in range(x_t.shape[0]):
+                    out[i, t] = k(X[i], Y[i], x_t[t], params)
+
+        _NUMBA_FILLERS[kernel] = fill
+    return _NUMBA_FILLERS[kernel]
+
+
+def build_kernel_matrix(X, Y, tendon_x_positions, kernel, params=(), dtype=np.float64, out=None,
+                        engine="auto", block_rows=1 << 14):
+    """Influence matrix ``A[i, t] = kernel(X[i], Y[i], tendon_x_positions[t], params)``.
+
+    ``engine`` is ``"numba"`` (parallel compiled loop), ``"numpy"`` (broadcast over row
+    blocks of ``block_rows``, bounded temporaries) or ``"auto"`` (Numba if installed).
+    ``out`` is an optional preallocated ``(len(X), T)`` array to fill, e.g. a memory map
+    or a shared-memory buffer; it is returned.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    Y = np.asarray(Y, dtype=np.float64)
+    x_t = np.asarray(tendon_x_positions, dtype=np.float64)
+    params = np.asarray(params, dtype=np.float64)
+    if out is None:
+        out = np.empty((len(X), len(x_t)), dtype=dtype)
+    elif out.shape != (len(X), len(x_t)):
+        raise ValueError(f"out has shape {out.shape}, expected {(len(X), len(x_t))}")
+    if engine == "auto":
+        engine = "numba" if numba_available() else "numpy"
+
+    if engine == "numba":
+        _numba_filler(kernel)(X, Y, x_t, params, np.asarray(out))  # plain ndarray view of memmaps
+    elif engine == "numpy":
+        for start in range(0, len(X), block_rows):
+            stop = start + block_rows
+            out[start:stop] = kernel(X[start:stop, None], Y[start:stop, None], x_t[None, :], params)
+    else:
+        raise ValueError(f"Unknown engine {engine!r}; choose 'numba', 'numpy' or 'auto'")
+    return out
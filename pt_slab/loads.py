@@ -0,0 +1,125 @@
+import numpy as np
+
+# ------------------------------------------------------
+# LOADS AND STRESSES
+# ------------------------------------------------------
+
+# If using structural software: replace these estimates with imported load values / stress results
+
+
+def total_load(t_slab, q_live, gamma_concrete=25.0):
+    """Design load ``q_dead + q_live`` (kN/m²) with the self weight as dead load."""
+    return gamma_concrete * t_slab + q_live
+
+
+def midspan_stress(q_total, span, t_slab, strip_width=1.0):
+    """Extreme fibre stress (MPa) of the simply supported midspan moment ``w·L²/8``."""
+    M = q_total * span ** 2 / 8
+    I = (strip_width * t_slab ** 3) / 12
+    y = t_slab / 2
+    return (M * 1e6) * (y * 1e3) / (I * 1e12)
+
+
+def strand_stress(cord_area, sigma_u, prestress_ratio, t_slab, strip_width=1.0):
+    """Average compression (MPa) of one strand over its influence area (a strip of the slab)."""
+    Ptendon = cord_area * sigma_u * prestress_ratio / 1e3  # kN
+    area_influence = t_slab * strip_width                  # m²
+    return (Ptendon / area_influence) / 1000
+
+
+def parabolic_targets(Y, sigma_max, Ly):
+    """Target stresses: parabola along Y peaking at ``sigma_max`` at midspan, zero at the supports."""
+    yc, half_span = Ly / 2, Ly / 2
+    Y = np.asarray(Y, dtype=np.float64)
+    return sigma_max * (1 - ((Y - yc) ** 2 / half_span ** 2))
+
+
+# ------------------------------------------------------
+# TARGET STRESS MODELS
+# ------------------------------------------------------
+
+# A target model maps control point coordinates to target stresses (MPa):
+#     model(X, Y) -> ndarray of len(X)
+# X and Y are 1-D arrays; any callable with this signature can be passed to optimize_slab.
+
+
+class TargetModel:
+    """Interface: ``model(X, Y) -> load_vector``."""
+
+    def __call__(self, X, Y):
+        raise NotImplementedError
+
+    def __add__(self, other):
+        return SuperposedTargets([(1.0, self), (1.0, other)])
+
+    def __rmul__(self, factor):
+        return SuperposedTargets([(factor, self)])
+
+
+class ParabolicTargets(TargetModel):
+    """Simply supported span along Y: ``sigma_max`` at midspan, zero at the supports."""
+
+    def __init__(self, sigma_max, Ly):
+        self.sigma_max = sigma_max
+        self.Ly = Ly
+
+    @classmethod
+    def from_load(cls, q, Ly, t_slab, strip_width=1.0):
+        """Parabola for a uniform load ``q`` (kN/m²) over the span ``Ly``."""
+        return cls(midspan_stress(q, Ly, t_slab, strip_width), Ly)
+
+    def __call__(self, X, Y):
+        return parabolic_targets(Y, self.sigma_max, self.Ly)
+
+
+class ImportedTargets(TargetModel):
+    """Target stresses imported at known points (e.g. FEA node results).
+
+    Queries at exactly the imported coordinates return the values as is; otherwise
+    the values are interpolated linearly (nearest value outside the imported hull).
+    """
+
+    def __init__(self, X, Y, values):
+        self.X = np.asarray(X, dtype=np.float64)
+        self.Y = np.asarray(Y, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64)
+        if not (self.X.shape == self.Y.shape == self.values.shape):
+            raise ValueError("X, Y and values must be 1-D arrays of the same length")
+        self._interpolators = None
+
+    def __call__(self, X, Y):
+        X = np.asarray(X, dtype=np.float64)
+        Y = np.asarray(Y, dtype=np.float64)
+        if X.shape == self.X.shape and np.array_equal(X, self.X) and np.array_equal(Y, self.Y):
+            return self.values.copy()
+        if self._interpolators is None:
+            from scipy.interpolate import LinearNDInterpolator, NearestNDInterpolator
+
+            points = np.column_stack([self.X, self.Y])
+            self._interpolators = (LinearNDInterpolator(points, self.values),
+                                   NearestNDInterpolator(points, self.values))
+        linear, nearest = self._interpolators
+        out = linear(X, Y)
+        outside = np.isnan(out)
+        out[outside] = nearest(X[outside], Y[outside])
+        return out
+
+
+class SuperposedTargets(TargetModel):
+    """Load combination: ``sum(factor * model(X, Y))`` over ``(factor, model)`` pairs."""
+
+    def __init__(self, cases):
+        self.cases = list(cases)
+
+    def __call__(self, X, Y):
+        out = np.zeros(len(X))
+        for factor, model in self.cases:
+            out += factor * np.asarray(model(X, Y), dtype=np.float64)
+        return out
+
+    def __add__(self, other):
+        others = other.cases if isinstance(other, SuperposedTargets) else [(1.0, other)]
+        return SuperposedTargets(self.cases + others)
+
+    def __rmul__(self, factor):
+        return SuperposedTargets([(factor * f, model) for f, model in self.cases])
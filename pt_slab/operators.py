@@ -0,0 +1,107 @@
+import numpy as np
+
+from .influence import eccentricity_factor, lateral_influence
+
+# ------------------------------------------------------
+# SEPARABLE INFLUENCE OPERATOR
+# ------------------------------------------------------
+
+# On a regular x_control × y_control grid the influence matrix factors as
+#   A[i * Ny + j, t] = G[i, t] * E[j]
+# with G the lateral term (Nx × T) and E the eccentricity term (Ny,),
+# i.e. A = kron(G, E[:, None]). Storing G and E costs O(Nx·T + Ny) instead of O(Nx·Ny·T).
+
+
+class InfluenceOperator:
+    """Matrix-free stand-in for the dense influence matrix ``A``.
+
+    Rows follow the script's control point order (``x`` outer, ``y`` inner).
+    Supports ``A @ v``, ``w @ A`` (transpose-matvec), ``A[rows]`` and ``A.shape``.
+    """
+
+    def __init__(self, lateral, ecc):
+        self.lateral = np.asarray(lateral)
+        self.ecc = np.asarray(ecc)
+        if self.lateral.ndim != 2 or self.ecc.ndim != 1:
+            raise ValueError("lateral must be 2-D (Nx, T) and ecc 1-D (Ny,)")
+        self.dtype = np.result_type(self.lateral, self.ecc)
+
+    @classmethod
+    def from_grid(cls, x_control, y_control, tendon_x_positions, Ly, e_design, t_slab, sigma=0.75,
+                  dtype=np.float64):
+        return cls(lateral_influence(x_control, tendon_x_positions, sigma, dtype),
+                   eccentricity_factor(y_control, Ly, e_design, t_slab, dtype))
+
+    @property
+    def grid_shape(self):
+        return self.lateral.shape[0], self.ecc.shape[0]
+
+    @property
+    def shape(self):
+        Nx, Ny = self.grid_shape
+        return Nx * Ny, self.lateral.shape[1]
+
+    ndim = 2
+    # Make ``ndarray @ operator`` defer to __rmatmul__ instead of treating us as a scalar
+    __array_ufunc__ = None
+
+    @property
+    def nbytes(self):
+        return self.lateral.nbytes + self.ecc.nbytes
+
+    def matvec(self, v):
+        """``A @ v`` for ``v`` of shape (T,) or (T, k)."""
+        v = np.asarray(v)
+        Gv = self.lateral @ v
+        if v.ndim == 1:
+            return np.multiply.outer(Gv, self.ecc).ravel()
+        out = Gv[:, None, :] * self.ecc[None, :, None]
+        return out.reshape(self.shape[0], v.shape[1])
+
+    def rmatvec(self, w):
+        """``A.T @ w`` for ``w`` of shape (Npc,)."""
+        W = np.asarray(w).reshape(self.grid_shape)
+        return self.lateral.T @ (W @ self.ecc)
+
+    def __matmul__(self, v):
+        return self.matvec(v)
+
+    def __rmatmul__(self, w):
+        return self.rmatvec(w)
+
+    def __getitem__(self, rows):
+        """Dense rows of ``A``; accepts an int, slice, index array or boolean mask."""
+        Ny = self.grid_shape[1]
+        if isinstance(rows, slice):
+            rows = np.arange(*rows.indices(self.shape[0]))
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        i, j = np.divmod(rows, Ny)
+        return self.lateral[i] * self.ecc[j][..., None]
+
+    def column(self, t):
+        """Column ``t`` of ``A`` (influence of one tendon on every control point)."""
+        return np.multiply.outer(self.lateral[:, t], self.ecc).ravel()
+
+    def toarray(self):
+        return self[np.arange(self.shape[0])]
+
+    def cvxpy_constraints(self, x, lower):
+        """Constraints ``A @ x >= lower`` for a cvxpy expression ``x`` without forming ``A``.
+
+        ``lower`` may be an array or a cvxpy expression/parameter of length ``Npc``.
+
+        A lifted variable ``z = G @ x`` (one entry per x_control column) keeps the
+        canonicalized problem at O(Nx·T + Nx·Ny) nonzeros instead of O(Nx·Ny·T).
+        """
+        import cvxpy as cp
+
+        Nx, Ny = self.grid_shape
+        z = cp.Variable(Nx)
+        stress = cp.reshape(z, (Nx, 1), order="C") @ self.ecc.reshape(1, Ny)
+        if isinstance(lower, cp.Expression):
+            lower = cp.reshape(lower, (Nx, Ny), order="C")
+        else:
+            lower = np.asarray(lower).reshape(Nx, Ny)
+        return [z == self.lateral @ x, stress >= lower]
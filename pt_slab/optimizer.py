@@ -0,0 +1,373 @@
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+
+from .backends import SolveResult, get_backend
+from .geometry import ControlPoints, control_grid, design_eccentricity, tendon_layout
+from .influence import build_influence_matrix, build_sparse_influence_matrix, truncation_stress_error
+from .integer import remove_excess_strands, solve_integer_strands
+from .kernels import separable_kernel
+from .loads import ParabolicTargets, midspan_stress, strand_stress, total_load
+from .operators import InfluenceOperator
+from .parallel import build_influence_shared
+from .reduction import proportional_groups, reduce_control_points
+from .sensitivity import Sensitivity
+from .solvers import StrandLP, solve_constraint_generation
+from .verify import StressCheck, check_stress, precheck
+
+# ------------------------------------------------------
+# HEADLESS PIPELINE: optimize_slab(config) -> SlabResult
+# ------------------------------------------------------
+
+# geometry → loads → influence → precheck → solve → integer strands → verify.
+# No printing, plotting or file access: see pt_slab.report for the text report and plots.
+
+
+@dataclass(frozen=True)
+class SlabConfig:
+    # Slab dimensions (m)
+    Lx: float = 8.0
+    Ly: float = 12.0
+    t_slab: float = 0.40
+
+    # Loads
+    gamma_concrete: float = 25.0      # kN/m³
+    q_live: float = 5.0               # kN/m²
+
+    # Tendons
+    tendon_spacing: float = 1.0       # m
+    cord_area: float = 150.0          # mm²
+    n_cord_max: int = 10
+    sigma_u: float = 1860.0           # MPa
+    prestress_ratio: float = 0.7
+
+    # Parabolic eccentricity profile
+    cover: float = 0.05               # m
+    ecc_factor: float = 1.0
+
+    # Control points and influence model
+    Npc: int = 10000
+    grid_dtype: str = "float64"       # "float32" halves control point coordinate memory
+    sigma: float = 0.75               # lateral Gaussian spread (m)
+    influence_mode: str = "dense"     # "dense", "operator" or "sparse"
+    sparse_tol: float = 1e-6
+    sparse_cutoff_sigmas: float = None
+    build_workers: int = 1            # > 1: dense A built by a process pool into shared memory
+    precision: str = "float64"        # "float32" stores A, load_vector and stress fields in float32
+    check_workers: int = None         # threads of the precheck / verification pass (None: one per core)
+
+    # Solver
+    solve_mode: str = "monolithic"    # "monolithic" or "active_set"
+    lp_backend: str = "cvxpy"         # "cvxpy", "highs" or "ipm"
+    use_reduction: bool = True
+    integer_mode: str = "ceil"        # "ceil", "greedy" or "milp"
+    milp_time_limit: float = 10.0     # s
+    milp_gap: float = 1e-3
+
+    # Quantity takeoff
+    steel_density: float = 7850.0     # kg/m³
+
+
+@dataclass
+class SlabResult:
+    config: SlabConfig
+    status: str                       # "optimal", "insufficient_prestress" or a solver status
+    sigma_max: float
+    e_max: float
+    e_design: float
+    stress_per_tendon: float
+    tendon_x_positions: np.ndarray
+    grid: ControlPoints               # ControlGrid unless the influence came from a store of FEA nodes
+    A: object = field(repr=False)
+    load_vector: np.ndarray = field(repr=False)
+    precheck_violations: int = 0
+    truncation_error: float = None
+    lp: SolveResult = None
+    lp_rows: int = None
+    sensitivity: Sensitivity = field(default=None, repr=False)
+    x_ceil: np.ndarray = None
+    x_opt: np.ndarray = None
+    mip: SolveResult = None
+    induced_stress: np.ndarray = field(default=None, repr=False)
+    final_stress: np.ndarray = field(default=None, repr=False)
+    n_violations: int = None
+    verification: StressCheck = field(default=None, repr=False)
+
+    @property
+    def optimal(self):
+        return self.status == "optimal"
+
+    @property
+    def feasible(self):
+        """An integer layout meets every stress constraint (also after a time-limited MILP)."""
+        return self.x_opt is not None and self.n_violations == 0
+
+    # Replace with quantity takeoff from structural software if available
+    @property
+    def mass_per_strand_kg(self):
+        tendon_length = self.config.Ly
+        return self.config.cord_area * 1e-6 * tendon_length * self.config.steel_density
+
+    @property
+    def total_strands_full(self):
+        return len(self.tendon_x_positions) * self.config.n_cord_max
+
+    @property
+    def total_strands_opt(self):
+        return int(np.sum(self.x_opt)) if self.x_opt is not None else None
+
+    @property
+    def mass_full(self):
+        return self.total_strands_full * self.mass_per_strand_kg
+
+    @property
+    def mass_opt(self):
+        return self.total_strands_opt * self.mass_per_strand_kg if self.x_opt is not None else None
+
+    @property
+    def steel_reduction(self):
+        """Fraction of steel saved against all tendons at ``n_cord_max``."""
+        return 1 - self.mass_opt / self.mass_full if self.x_opt is not None else None
+
+
+# ------------------------------------------------------
+# STAGES
+# ------------------------------------------------------
+
+
+def storage_dtype(config):
+    """dtype of the influence matrix and the stress fields (``config.precision``)."""
+    if config.precision not in ("float64", "float32"):
+        raise ValueError(f"Unknown precision {config.precision!r}; choose 'float64' or 'float32'")
+    return np.dtype(config.precision)
+
+
+def build_influence(config, grid, tendon_x_positions, e_design):
+    """Influence matrix in the representation selected by ``config.influence_mode``."""
+    c = config
+    dtype = storage_dtype(c)
+    if c.influence_mode == "operator":
+        return InfluenceOperator.from_grid(grid.x_control, grid.y_control, tendon_x_positions, c.Ly, e_design,
+                                           c.t_slab, c.sigma, dtype=dtype)
+    if c.influence_mode == "sparse":
+        return build_sparse_influence_matrix(grid.X, grid.Y, tendon_x_positions, c.Ly, e_design, c.t_slab, c.sigma,
+                                             tol=c.sparse_tol, cutoff_sigmas=c.sparse_cutoff_sigmas, dtype=dtype)
+    if c.influence_mode == "dense" and c.build_workers > 1:
+        return build_influence_shared(grid.X, grid.Y, tendon_x_positions, separable_kernel,
+                                      (c.Ly, e_design, c.t_slab, c.sigma), dtype=dtype, max_workers=c.build_workers)
+    if c.influence_mode == "dense":
+        return build_influence_matrix(grid.X, grid.Y, tendon_x_positions, c.Ly, e_design, c.t_slab, c.sigma, dtype)
+    raise ValueError(f"Unknown influence_mode {c.influence_mode!r}")
+
+
+def exact_rows(config, e_design, points, tendon_x_positions, load_vector, A):
+    """``rows -> (A_rows, load_rows)`` in float64 from the influence model of ``config``.
+
+    Used to re-check near-binding control points when ``A`` is stored in float32; rows
+    of a sparse ``A`` keep its truncation pattern. ``load_vector`` holds the float64
+    targets (an array or memory map), indexed by row rather than re-evaluated: the
+    target model may be costly on a subset (e.g. interpolation of imported FEA nodes).
+    """
+    c = config
+
+    def rows_float64(rows):
+        X = np.asarray(points.X[rows], dtype=np.float64)
+        Y = np.asarray(points.Y[rows], dtype=np.float64)
+        A_rows = build_influence_matrix(X, Y, tendon_x_positions, c.Ly, e_design, c.t_slab, c.sigma)
+        if hasattr(A, "tocsr"):
+            A_rows[A[rows].toarray() == 0] = 0
+        return A_rows, np.asarray(load_vector[rows], dtype=np.float64)
+
+    return rows_float64
+
+
+def make_influence(config, e_design):
+    """Tendon layout, control grid and influence matrix of ``config``: ``(A, grid, tendon_x_positions)``."""
+    c = config
+    tendon_x_positions = tendon_layout(c.Lx, c.tendon_spacing)
+    grid = control_grid(c.Lx, c.Ly, c.Npc, dtype=np.dtype(c.grid_dtype))
+    return build_influence(c, grid, tendon_x_positions, e_design), grid, tendon_x_positions
+
+
+class SharedInfluence:
+    """Influence matrix of one geometry plus the LP structures derived from it, shared by load cases.
+
+    Pass it as ``optimize_slab(config, influence=shared)`` for every load case of the geometry:
+    the proportional row groups (reduction) and the compiled cvxpy LP are built on first use
+    and reused afterwards.
+    """
+
+    def __init__(self, A, points, tendon_x_positions, config=None):
+        self.A = A
+        self.points = points
+        self.tendon_x_positions = tendon_x_positions
+        self.config = config            # geometry A was built from, if any (float64 re-checks)
+        self._groups = None
+        self._strand_lp = {}
+
+    @classmethod
+    def from_config(cls, config, cache=None):
+        """Influence of ``config``'s geometry (looked up in / added to ``cache`` if given)."""
+        c = config
+        store = cache.get(c) if cache is not None else None
+        if store is not None:
+            return cls(store.A, store.points, store.tendon_x_positions, c)
+        A, grid, tendon_x_positions = make_influence(c, design_eccentricity(c.t_slab, c.cover, c.ecc_factor)[1])
+        if cache is not None:
+            cache.put(c, A, grid, tendon_x_positions)
+        return cls(A, grid, tendon_x_positions, c)
+
+    @property
+    def groups(self):
+        if self._groups is None:
+            self._groups = proportional_groups(self.A)
+        return self._groups
+
+    def strand_lp(self, stress_per_tendon, n_cord_max, reduce=True):
+        """Compiled ``StrandLP`` (one per ``reduce`` setting; strand stress and bound are re-set per solve)."""
+        if reduce not in self._strand_lp:
+            self._strand_lp[reduce] = StrandLP(self.A, stress_per_tendon, n_cord_max, reduce=reduce,
+                                               groups=self.groups if reduce else None)
+        return self._strand_lp[reduce]
+
+
+def _lp_rows(A, load_vector, config, shared=None):
+    """Control points kept in the LP: non-dominated ones with ``use_reduction``, else all."""
+    if not config.use_reduction:
+        return np.arange(len(load_vector))
+    return reduce_control_points(A, load_vector, groups=shared.groups if shared is not None else None)
+
+
+def solve_lp(A, load_vector, stress_per_tendon, config, shared=None):
+    """Continuous strand LP; returns ``(SolveResult, number of LP rows)``.
+
+    ``shared`` (a ``SharedInfluence`` of ``A``) supplies the reduction groups and compiled LP.
+    """
+    c = config
+    if c.solve_mode == "active_set":
+        # Runs on the full control point set: the full-set check inside the loop replaces the reduction
+        result = solve_constraint_generation(A, load_vector, stress_per_tendon, c.n_cord_max,
+                                             backend=get_backend(c.lp_backend))
+        return result, len(result.active_rows)
+    if c.solve_mode != "monolithic":
+        raise ValueError(f"Unknown solve_mode {c.solve_mode!r}")
+    if c.lp_backend == "cvxpy":
+        if shared is not None:
+            lp = shared.strand_lp(stress_per_tendon, c.n_cord_max, reduce=c.use_reduction)
+        else:
+            lp = StrandLP(A, stress_per_tendon, c.n_cord_max, reduce=c.use_reduction)
+        return lp.solve(load_vector, stress_per_tendon, c.n_cord_max), lp.n_rows
+    backend = get_backend(c.lp_backend)
+    if not c.use_reduction:
+        # All rows: hand A over as is (A[rows] would copy it)
+        return backend.solve(A, load_vector, stress_per_tendon, c.n_cord_max), len(load_vector)
+    rows = _lp_rows(A, load_vector, c, shared)
+    result = backend.solve(A[rows], load_vector[rows], stress_per_tendon, c.n_cord_max)
+    result.active_rows = rows
+    return result, len(rows)
+
+
+def integer_strands(A, load_vector, x_lp, stress_per_tendon, config, shared=None):
+    """Integer layout from the LP solution; returns ``(x_opt, x_ceil, mip SolveResult or None)``."""
+    c = config
+    # Round strands to nearest upper integer (to ensure constraints are satisfied); the
+    # tolerance absorbs solver noise around integers (e.g. 1e-10 from the interior point)
+    x_ceil = np.ceil(x_lp - 1e-9).astype(int)
+    if c.integer_mode == "milp":
+        if c.use_reduction:     # else all rows: A as is (A[rows] would copy it)
+            rows = _lp_rows(A, load_vector, c, shared)
+            A, load_vector = A[rows], load_vector[rows]
+        mip = solve_integer_strands(A, load_vector, stress_per_tendon, c.n_cord_max, x_lp=x_lp,
+                                    time_limit=c.milp_time_limit, mip_gap=c.milp_gap)
+        return mip.x, x_ceil, mip
+    if c.integer_mode == "greedy":
+        return remove_excess_strands(A, load_vector, x_ceil, stress_per_tendon), x_ceil, None
+    if c.integer_mode == "ceil":
+        return x_ceil, x_ceil, None
+    raise ValueError(f"Unknown integer_mode {c.integer_mode!r}")
+
+
+# ------------------------------------------------------
+# ENTRY POINT
+# ------------------------------------------------------
+
+
+def optimize_slab(config=None, targets=None, influence=None, cache=None, **overrides):
+    """Run the full pipeline for one slab and return a ``SlabResult`` (no I/O, no plots).
+
+    ``targets`` is a target stress model ``targets(X, Y) -> load_vector`` (see
+    ``pt_slab.loads``); by default the parabola of the self weight plus live load.
+    ``influence`` is a saved ``pt_slab.store.InfluenceStore``: its matrix, control points
+    and tendon positions replace the generated ones (no FEA runs, no rebuild); a
+    ``SharedInfluence`` additionally shares its reduction and compiled LP across calls.
+    ``cache`` is a ``pt_slab.cache.InfluenceCache``: the matrix is looked up by the
+    geometry fields of the config and built and stored only on a miss.
+    With ``precision="float32"`` the final verification stays exact: control points within
+    float32 rounding of their target are re-checked on float64 rows of the influence model
+    (only possible when ``A`` follows the config; a float32 store is checked as stored).
+    ``overrides`` replace fields of ``config`` (or of the default ``SlabConfig``).
+    Infeasible cases are reported through ``status`` rather than raised.
+    """
+    c = replace(config or SlabConfig(), **overrides)
+
+    # Geometry and loads
+    sigma_max = midspan_stress(total_load(c.t_slab, c.q_live, c.gamma_concrete), c.Ly, c.t_slab)
+    stress_per_tendon = strand_stress(c.cord_area, c.sigma_u, c.prestress_ratio, c.t_slab)
+    e_max, e_design = design_eccentricity(c.t_slab, c.cover, c.ecc_factor)
+
+    # Influence matrix and targets
+    from_config = influence is None             # A follows the config (possibly through the cache)
+    if from_config and cache is not None:
+        influence = cache.get(c)
+    if influence is not None:
+        A, grid, tendon_x_positions = influence.A, influence.points, influence.tendon_x_positions
+    else:
+        A, grid, tendon_x_positions = make_influence(c, e_design)
+        if cache is not None:
+            cache.put(c, A, grid, tendon_x_positions)
+    targets = targets or ParabolicTargets(sigma_max, c.Ly)
+    dtype = storage_dtype(c)
+    load_float64 = np.asarray(targets(grid.X, grid.Y), dtype=np.float64)
+    load_vector = load_float64.astype(dtype, copy=False)
+    result = SlabResult(c, "optimal", sigma_max, e_max, e_design, stress_per_tendon, tendon_x_positions, grid, A,
+                        load_vector)
+    if c.influence_mode == "sparse" and from_config:
+        # Truncation only drops non-negative terms: the error at full prestress bounds any layout
+        result.truncation_error = truncation_stress_error(
+            A, grid.X, grid.Y, tendon_x_positions, c.Ly, e_design, c.t_slab,
+            np.full(len(tendon_x_positions), c.n_cord_max * stress_per_tendon), c.sigma)
+
+    # float64 re-check of near-binding rows for a float32 matrix of the config's geometry
+    recheck = None
+    if np.dtype(A.dtype) != np.float64 and (from_config or getattr(influence, "config", None) is not None):
+        recheck = exact_rows(c, e_design, grid, tendon_x_positions, load_float64, A)
+    del load_float64
+
+    # Precheck: all tendons active
+    result.precheck_violations = precheck(A, load_vector, stress_per_tendon, c.n_cord_max, recheck, c.check_workers)
+    if result.precheck_violations:
+        result.status = "insufficient_prestress"
+        return result
+
+    # Optimization and integer strands (the reduction groups are built once for both)
+    shared = influence if isinstance(influence, SharedInfluence) else SharedInfluence(A, grid, tendon_x_positions)
+    result.lp, result.lp_rows = solve_lp(A, load_vector, stress_per_tendon, c, shared)
+    if not result.lp.optimal:
+        result.status = result.lp.status
+        return result
+    result.sensitivity = Sensitivity.from_solve(result.lp, grid.X, grid.Y)
+    result.x_opt, result.x_ceil, result.mip = integer_strands(A, load_vector, result.lp.x, stress_per_tendon, c,
+                                                             shared)
+    if result.mip is not None and not result.mip.optimal:
+        # "optimal_inaccurate": the time limit stopped the MILP; its layout is still verified
+        result.status = result.mip.status
+    if result.x_opt is None:
+        return result
+
+    # Final verification (always over the full control point set)
+    result.induced_stress = np.empty(len(load_vector), dtype=dtype)
+    result.verification = check_stress(A, result.x_opt, load_vector, stress_per_tendon, exact_rows=recheck,
+                                       out=result.induced_stress, max_workers=c.check_workers)
+    result.n_violations = result.verification.n_violations
+    result.final_stress = load_vector - result.induced_stress
+    return result
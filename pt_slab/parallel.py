@@ -0,0 +1,80 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .kernels import build_kernel_matrix
+
+# ------------------------------------------------------
+# PARALLEL INFLUENCE BUILD INTO SHARED MEMORY
+# ------------------------------------------------------
+
+# For expensive kernels (plate series, FE interpolation) the build itself is the
+# bottleneck. The final matrix is allocated once in a multiprocessing.shared_memory
+# block; every worker attaches to the block by name and writes its own range of rows
+# straight into it with build_kernel_matrix(out=...). Workers return nothing, so no
+# partial result is pickled and nothing is concatenated afterwards: the parent's array
+# is the block itself. Only the control point coordinates of each range are sent.
+#
+# The block's name is unlinked as soon as the build is done (the memory stays mapped
+# until the last array using it is released), so a crash never leaks /dev/shm entries.
+
+
+class SharedArray(np.ndarray):
+    """``ndarray`` over a shared memory block, which stays alive as long as the array or a view of it."""
+
+    def __array_finalize__(self, obj):
+        self._shm = getattr(obj, "_shm", None)
+
+    def __array_wrap__(self, array, context=None, return_scalar=False):
+        # ufunc / matmul results are new arrays and need not pin the shared block
+        array = array.view(np.ndarray)
+        return array[()] if return_scalar else array
+
+
+def _fill_rows(name, shape, dtype, start, X, Y, tendon_x_positions, kernel, params, engine):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        A = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        build_kernel_matrix(X, Y, tendon_x_positions, kernel, params, out=A[start:start + len(X)], engine=engine)
+        del A
+    finally:
+        shm.close()
+
+
+def build_influence_shared(X, Y, tendon_x_positions, kernel, params=(), dtype=np.float64, max_workers=None,
+                           chunk_rows=1 << 16, engine="numpy"):
+    """Influence matrix of ``kernel`` (see ``pt_slab.kernels``) built by a process pool.
+
+    Rows are split into ranges of ``chunk_rows`` written by the workers directly into
+    the returned ``SharedArray``. ``kernel`` must be picklable (a module-level function).
+    ``max_workers=1`` fills the block in-process.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    Y = np.asarray(Y, dtype=np.float64)
+    tendon_x_positions = np.asarray(tendon_x_positions, dtype=np.float64)
+    shape = (len(X), len(tendon_x_positions))
+    dtype = np.dtype(dtype)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    try:
+        starts = range(0, shape[0], chunk_rows)
+        args = [(shm.name, shape, dtype, start, X[start:start + chunk_rows], Y[start:start + chunk_rows],
+                 tendon_x_positions, kernel, params, engine) for start in starts]
+        max_workers = min(max_workers or os.cpu_count(), len(args)) or 1
+        if max_workers == 1:
+            for a in args:
+                _fill_rows(*a)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                for future in [pool.submit(_fill_rows, *a) for a in args]:
+                    future.result()
+        A = np.ndarray(shape, dtype=dtype, buffer=shm.buf).view(SharedArray)
+        A._shm = shm
+    except BaseException:
+        shm.close()
+        raise
+    finally:
+        shm.unlink()
+    return A
@@ -0,0 +1,57 @@
+import matplotlib.pyplot as plt
+
+# ------------------------------------------------------
+# PLOTS (OPTIONAL: IMPORTS MATPLOTLIB)
+# ------------------------------------------------------
+
+# Not imported by pt_slab itself; import this module only when a figure is needed.
+
+
+def plot_layout(result):
+    """Bar chart of the optimized strands per tendon; returns the figure."""
+    fig = plt.figure(figsize=(10, 4))
+    plt.bar(result.tendon_x_positions, result.x_opt, width=0.8, align='center', color='steelblue',
+            edgecolor='black')
+    plt.title("Optimized Tendon Layout")
+    plt.xlabel("Tendon Position (m)")
+    plt.ylabel("Number of Strands")
+    plt.xticks(result.tendon_x_positions)
+    plt.grid(True, axis='y', linestyle='--', alpha=0.7)
+    plt.tight_layout()
+    return fig
+
+
+def plot_stresses(result):
+    """Target, induced and final stress maps over the control points; returns the figure."""
+    X, Y = result.grid.X, result.grid.Y
+    load_vector, induced_stress, final_stress = result.load_vector, result.induced_stress, result.final_stress
+    vmin = min(load_vector.min(), induced_stress.min(), final_stress.min())
+    vmax = max(load_vector.max(), induced_stress.max(), final_stress.max())
+
+    fig, axs = plt.subplots(1, 3, figsize=(18, 5))
+
+    sc1 = axs[0].scatter(X, Y, c=load_vector, cmap='jet', vmin=vmin, vmax=vmax)
+    axs[0].set_title("Initial Stress (σ_DL+LL)")
+    plt.colorbar(sc1, ax=axs[0], label="MPa")
+
+    sc2 = axs[1].scatter(X, Y, c=induced_stress, cmap='jet', vmin=vmin, vmax=vmax)
+    axs[1].set_title("Induced Stress (σ_PT)")
+    plt.colorbar(sc2, ax=axs[1], label="MPa")
+
+    sc3 = axs[2].scatter(X, Y, c=final_stress, cmap='jet', vmin=vmin, vmax=vmax)
+    axs[2].set_title("Final Stress (σ_DL+LL - σ_PT)")
+    plt.colorbar(sc3, ax=axs[2], label="MPa")
+
+    for ax in axs:
+        ax.set_aspect('equal')
+        ax.set_xlabel("X (m)")
+        ax.set_ylabel("Y (m)")
+
+    plt.tight_layout(rect=[0, 0.05, 1, 1])
+    fig.text(0.5, 0.01, "Note: Negative values indicate compression, positive values indicate tension.",
+             ha='center', fontsize=10, style='italic')
+    return fig
+
+
+def show():
+    plt.show()
@@ -0,0 +1,177 @@
+import numpy as np
+
+from .operators import InfluenceOperator
+
+# ------------------------------------------------------
+# CONTROL POINT REDUCTION (CONSTRAINT DOMINANCE)
+# ------------------------------------------------------
+
+# Two stress constraints a_i·x >= b_i and a_k·x >= b_k with a_i = c·a_k (c > 0)
+# collapse to the one with the larger ratio b / c: the other is implied.
+# With the simplified influence model every control point of an x_control column
+# has a proportional row (only the eccentricity factor changes along Y), so the
+# LP keeps one row per column. Additionally, when A >= 0 a row with b <= 0 is
+# satisfied by any non-negative strand layout and can be dropped.
+#
+# The grouping depends on A only; the binding row of each group depends on the
+# load vector, so several load cases can share one grouping (see group_targets).
+
+
+class ProportionalGroups:
+    """Control points grouped by proportional influence rows.
+
+    ``A[i] = scale[i] * directions[group[i]]`` with ``directions`` the row-normalised
+    (max |a| = 1) influence of each group. Zero rows get ``scale = 0`` and their own group.
+    """
+
+    def __init__(self, group, scale, representatives, nonnegative):
+        self.group = group
+        self.scale = scale
+        self.representatives = representatives
+        self.nonnegative = nonnegative
+
+    @property
+    def n_groups(self):
+        return len(self.representatives)
+
+    def directions(self, A):
+        """Row-normalised influence of each group, ``(n_groups, T)`` (sparse if ``A`` is)."""
+        rows = A[self.representatives]
+        scale = self.scale[self.representatives]
+        inv = np.divide(1.0, scale, out=np.zeros_like(scale, dtype=float), where=scale > 0)
+        if hasattr(rows, "multiply"):
+            return rows.multiply(inv[:, None]).tocsr()
+        return rows * inv[:, None]
+
+    def targets(self, load_vector):
+        """Per-group right-hand side ``max(b_i / scale_i)``; zero rows keep ``b`` (infeasible if > 0)."""
+        load_vector = np.asarray(load_vector, dtype=float)
+        ratio = np.divide(load_vector, self.scale, out=load_vector.copy(), where=self.scale > 0)
+        out = np.full(self.n_groups, -np.inf)
+        np.maximum.at(out, self.group, ratio)
+        return out
+
+    def binding_rows(self, load_vector):
+        """Index of the most demanding control point of each group."""
+        load_vector = np.asarray(load_vector, dtype=float)
+        ratio = np.divide(load_vector, self.scale, out=load_vector.copy(), where=self.scale > 0)
+        order = np.lexsort((-ratio, self.group))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = self.group[order[1:]] != self.group[order[:-1]]
+        return order[first]
+
+
+def proportional_groups(A, decimals=None, block_rows=1 << 14):
+    """Group the rows of ``A`` (dense, scipy sparse or ``InfluenceOperator``) by direction.
+
+    Normalised rows are compared to ``decimals`` places: 10 for float64 storage, 5 for
+    float32 (whose quotients of proportional rows differ in the 7th digit). Dense and
+    memory-mapped ``A`` are read in blocks of ``block_rows`` (no full-size temporaries).
+    """
+    if decimals is None:
+        decimals = 10 if np.dtype(A.dtype).itemsize >= 8 else 5
+    if isinstance(A, InfluenceOperator):
+        Nx, Ny = A.grid_shape
+        group = np.repeat(np.arange(Nx), Ny)
+        scale = np.multiply.outer(A.lateral.max(axis=1), A.ecc).ravel()
+        nonnegative = A.lateral.min(initial=0) >= 0 and A.ecc.min(initial=1) > 0
+        return ProportionalGroups(group, scale, np.arange(Nx) * Ny, nonnegative)
+
+    if hasattr(A, "tocsr"):
+        A = A.tocsr()
+        scale = abs(A).max(axis=1).toarray().ravel()
+        keys = _sparse_row_keys(A, scale, decimals)
+        nonnegative = A.nnz == 0 or A.data.min() >= 0
+    else:
+        return _dense_groups(A, decimals, block_rows)
+
+    # Zero rows are offset so they never share a group with a non-zero row
+    keys = np.column_stack([scale == 0, keys])
+    _, representatives, group = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    return ProportionalGroups(group.ravel(), scale, representatives, nonnegative)
+
+
+def reduce_control_points(A, load_vector, decimals=None, groups=None):
+    """Indices of the control points that are not dominated by another one.
+
+    Solving the LP on ``A[rows] @ x >= load_vector[rows]`` gives the same optimum
+    as the full problem; callers should still re-verify the full set afterwards.
+    Works with dense arrays, scipy sparse matrices and ``InfluenceOperator``.
+    """
+    load_vector = np.asarray(load_vector)
+    groups = groups or proportional_groups(A, decimals)
+    rows = groups.binding_rows(load_vector)
+
+    # Zero rows are kept only when they are infeasible (b > 0), so the solver reports it
+    zero_row = groups.scale[rows] == 0
+    drop = zero_row & (load_vector[rows] <= 0)
+    if groups.nonnegative:
+        drop |= ~zero_row & (load_vector[rows] <= 0)
+    return np.sort(rows[~drop])
+
+
+# Dense rows are grouped by a 64-bit hash of the rounded normalised row, computed one
+# block at a time, so a memory-mapped matrix larger than RAM is only streamed. A second
+# streamed pass compares every row with its group representative; rows of a (very
+# unlikely) hash collision get groups of their own, which only costs reduction.
+
+
+def _normalised_rows(block, decimals):
+    block = np.asarray(block, dtype=np.float64)
+    scale = np.abs(block).max(axis=1, initial=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        keys = np.round(block / scale[:, None], decimals)
+    keys[scale == 0] = 0
+    return keys + 0.0, scale        # + 0.0 turns -0.0 into 0.0 (same bits for equal keys)
+
+
+def _row_hashes(keys):
+    h = np.full(len(keys), 0xCBF29CE484222325, dtype=np.uint64)
+    for word in keys.view(np.uint64).T:
+        h ^= word
+        h *= np.uint64(0x100000001B3)
+        h ^= h >> np.uint64(29)
+    return h
+
+
+def _dense_groups(A, decimals, block_rows):
+    n_rows = A.shape[0]
+    scale = np.empty(n_rows)
+    hashes = np.empty(n_rows, dtype=np.uint64)
+    nonnegative = True
+    for start in range(0, n_rows, block_rows):
+        block = A[start:start + block_rows]
+        keys, scale[start:start + block_rows] = _normalised_rows(block, decimals)
+        hashes[start:start + block_rows] = _row_hashes(keys)
+        nonnegative &= bool(block.min(initial=0) >= 0)
+    hashes[scale == 0] = 0              # zero rows never share a group with a non-zero row
+    hashes[scale != 0] |= np.uint64(1)
+    _, representatives, group = np.unique(hashes, return_index=True, return_inverse=True)
+    group = group.ravel()
+
+    # Collision check against the representatives
+    collided = []
+    for start in range(0, n_rows, block_rows):
+        keys = _normalised_rows(A[start:start + block_rows], decimals)[0]
+        rep_keys = _normalised_rows(A[representatives[group[start:start + block_rows]]], decimals)[0]
+        same = (keys == rep_keys).all(axis=1)
+        collided.append(start + np.flatnonzero(~same))
+    collided = np.concatenate(collided)
+    if len(collided):
+        group[collided] = len(representatives) + np.arange(len(collided))
+        representatives = np.append(representatives, collided)
+    return ProportionalGroups(group, scale, representatives, nonnegative)
+
+
+def _sparse_row_keys(A, scale, decimals):
+    """Row-normalised CSR rows as fixed-width keys: (column indices | values), padded."""
+    A = A.sorted_indices()
+    counts = np.diff(A.indptr)
+    width = int(counts.max(initial=0))
+    rows = np.repeat(np.arange(A.shape[0]), counts)
+    pos = np.arange(A.nnz) - A.indptr[rows]
+    keys = np.zeros((A.shape[0], 2 * width))
+    keys[:, :width] = -1
+    keys[rows, pos] = A.indices
+    keys[rows, width + pos] = np.round(A.data / scale[rows], decimals)
+    return keys
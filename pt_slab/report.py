@@ -0,0 +1,74 @@
+# ------------------------------------------------------
+# REPORTING: TEXT SUMMARY
+# ------------------------------------------------------
+
+# Plain text only; plots live in pt_slab.plotting, which is the only module importing
+# matplotlib (several hundred ms of startup) and is imported only when a plot is requested.
+
+
+def report_lines(result):
+    """Console report of a ``SlabResult``, in the order the pipeline runs."""
+    c = result.config
+    lines = [
+        f"Estimated σ_max at midspan = {result.sigma_max:.2f} MPa",
+        f"Maximum usable eccentricity: {result.e_max:.3f} m",
+        f"Design eccentricity used: {result.e_design:.3f} m",
+    ]
+    if hasattr(result.grid, "shape"):
+        lines.append(f"Using {result.grid.size} control points in a {result.grid.shape[0]} x {result.grid.shape[1]} grid")
+    else:
+        lines.append(f"Using {result.grid.size} control points")
+    A = result.A
+    if result.truncation_error is not None:
+        lines.append(f"Sparse A: {A.nnz} nonzeros ({A.nnz / (A.shape[0] * A.shape[1]):.1%} of dense), "
+                     f"max truncation stress error = {result.truncation_error:.2e} MPa")
+
+    lines.append("\n=== PRECHECK: All Tendons Active ===")
+    if result.precheck_violations:
+        lines += [
+            f"❌ {result.precheck_violations} control points do NOT meet the stress requirements.",
+            "⚠️  The maximum allowed post-tensioning is not sufficient to meet stress criteria across the entire slab.",
+            "   → Consider increasing the number of strands per tendon, reducing span, or increasing slab thickness.",
+        ]
+        return lines
+    lines.append("✅ All stress constraints are satisfied with all tendons active.")
+
+    lp = result.lp
+    n_points = len(result.load_vector)
+    if c.solve_mode == "active_set":
+        lines.append(f"Solved: {lp.iterations} passes, {result.lp_rows} of {n_points} control points active "
+                     f"({c.lp_backend}, {lp.solve_time:.3f} s).")
+    else:
+        if c.use_reduction:
+            lines.append(f"Constraint reduction: {result.lp_rows} of {n_points} control points kept in the LP")
+        lines.append(f"Solved: {lp.status} ({c.lp_backend}, {lp.solve_time:.3f} s).")
+    if result.sensitivity is not None:
+        capped = result.sensitivity.capped_tendons
+        lines.append(f"Binding control points: {len(result.sensitivity.binding)}; tendons limited by n_cord_max: "
+                     f"{', '.join(map(str, capped)) if len(capped) else 'none'}")
+    if not lp.optimal or result.x_opt is None:
+        return lines
+
+    saved = int(result.x_ceil.sum() - result.x_opt.sum())
+    if result.mip is not None:
+        mip = result.mip
+        lines.append(f"MILP ({mip.status}, gap {mip.mip_gap:.2%}, {mip.solve_time:.2f} s): "
+                     f"{result.total_strands_opt} strands vs {result.x_ceil.sum()} with plain ceiling")
+    elif c.integer_mode == "greedy":
+        lines.append(f"Greedy strand removal: {result.total_strands_opt} strands, {saved} saved vs plain ceiling")
+
+    if result.n_violations > 0:
+        check = result.verification
+        lines.append(f"⚠️ Warning: {result.n_violations} stress constraints violated after rounding "
+                     f"(worst margin {check.worst_margin:.3f} MPa at control points "
+                     f"{', '.join(map(str, check.worst_rows))}).")
+    else:
+        lines.append("✅ All stress constraints satisfied after rounding.")
+
+    lines += [
+        "\n=== POST-TENSIONING MASS COMPARISON ===",
+        f"Full PT: {result.total_strands_full:.0f} strands → {result.mass_full:.1f} kg",
+        f"Optimized PT: {result.total_strands_opt:.0f} strands → {result.mass_opt:.1f} kg",
+        f"Steel reduction: {result.steel_reduction * 100:.1f}%",
+    ]
+    return lines
@@ -0,0 +1,85 @@
+import numpy as np
+
+# ------------------------------------------------------
+# LP SENSITIVITY (DUAL VALUES)
+# ------------------------------------------------------
+
+# For the strand LP  min sum(n)  s.t.  A @ (n * s) >= b,  0 <= n <= n_cord_max  the dual
+# value y_i >= 0 of control point i is ∂(total strands) / ∂b_i: only the handful of binding
+# points have y_i > 0. A load change Δb therefore moves the optimum by about y @ Δb, which
+# only needs Δb at the binding points. The optimal value is convex in b, so the estimate is
+# exact while the binding set stays the same and a lower bound on the increase beyond that.
+# Estimates are in continuous strands (the LP objective), before integer rounding.
+
+
+class Sensitivity:
+    """Dual values of an LP solve, mapped back to the full control point set.
+
+    ``binding`` are the control points with a positive dual, ``binding_duals`` their
+    duals (strands per MPa of target stress); ``upper_duals[t]`` is the number of strands
+    saved per extra strand allowed in tendon ``t`` (> 0 only for tendons at ``n_cord_max``).
+    """
+
+    def __init__(self, objective, binding, binding_duals, upper_duals, lower_duals, n_points, X, Y):
+        self.objective = objective
+        self.binding = binding
+        self.binding_duals = binding_duals
+        self.upper_duals = upper_duals
+        self.lower_duals = lower_duals
+        self.n_points = n_points
+        self._X = X
+        self._Y = Y
+
+    @classmethod
+    def from_solve(cls, lp, X, Y, tol=1e-6):
+        """Sensitivity of an optimal ``SolveResult`` (``None`` if it carries no duals).
+
+        ``lp.duals[k]`` belongs to control point ``lp.active_rows[k]`` (row ``k`` when unset).
+        Duals below ``tol`` relative to the largest one are zeroed: interior-point solvers
+        (ECOS) leave tiny positive values on every non-binding constraint.
+        """
+        if not lp.optimal or lp.duals is None:
+            return None
+        rows = lp.active_rows if lp.active_rows is not None else np.arange(len(lp.duals))
+        duals = np.asarray(lp.duals, dtype=float)
+        cutoff = tol * max(1.0, duals.max(initial=0))
+        keep = duals > cutoff
+        order = np.argsort(rows[keep])
+        upper, lower = (np.where(d > cutoff, d, 0.0) for d in (lp.upper_duals, lp.lower_duals))
+        return cls(lp.objective, rows[keep][order], duals[keep][order], upper, lower, len(X), X, Y)
+
+    @property
+    def duals(self):
+        """Dual value of every control point (zero for non-binding points)."""
+        out = np.zeros(self.n_points)
+        out[self.binding] = self.binding_duals
+        return out
+
+    @property
+    def capped_tendons(self):
+        """Tendons whose strand bound ``n_cord_max`` limits the optimum."""
+        return np.flatnonzero(self.upper_duals > 0)
+
+    def load_change(self, delta):
+        """Estimated change in total strands for a change ``delta`` of the target stresses.
+
+        ``delta`` is a full-length array or a target model ``delta(X, Y)``, which is then
+        evaluated at the binding points only.
+        """
+        if callable(delta):
+            delta_b = np.asarray(delta(self._X[self.binding], self._Y[self.binding]), dtype=float)
+        else:
+            delta_b = np.asarray(delta, dtype=float)[self.binding]
+        return float(self.binding_duals @ delta_b)
+
+    def scale_load(self, component, factor):
+        """Estimated change in total strands when the load ``component`` is scaled by ``factor``.
+
+        ``component`` is the target stress of one load case (array or target model) included in
+        the solved loads, e.g. ``ParabolicTargets.from_load(q_live, Ly, t_slab)``.
+        """
+        return (factor - 1) * self.load_change(component)
+
+    def cap_change(self, delta_n_cord_max):
+        """Estimated change in total strands when every tendon's strand bound moves by ``delta_n_cord_max``."""
+        return -float(self.upper_duals.sum()) * delta_n_cord_max
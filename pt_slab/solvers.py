@@ -0,0 +1,164 @@
+import time
+
+import numpy as np
+
+from .backends import SolveResult, cvxpy_duals, get_backend
+from .operators import InfluenceOperator
+from .reduction import proportional_groups
+from .verify import induced_stress
+
+# ------------------------------------------------------
+# LP SOLVERS: MINIMIZE TOTAL STRANDS
+# ------------------------------------------------------
+
+#   minimize  sum(n)
+#   s.t.      A @ (n * stress_per_tendon) >= load_vector
+#             0 <= n <= n_cord_max
+# ``A`` may be a dense array, a scipy sparse matrix or an InfluenceOperator.
+
+
+def stress_margin(A, x, load_vector, stress_per_tendon):
+    """Induced minus target stress per control point (negative = violated)."""
+    return induced_stress(A, x, stress_per_tendon) - load_vector
+
+
+# ------------------------------------------------------
+# COMPILED (PARAMETRIZED) LP
+# ------------------------------------------------------
+
+# cvxpy canonicalization dominates when the same slab is solved for many load cases.
+# The load vector, strand stress and strand bound are cp.Parameters, so the problem is
+# compiled on the first solve and later solves only substitute the new values.
+
+
+class StrandLP:
+    """Strand LP for a fixed influence matrix, compiled once and re-solved per load case.
+
+    With ``reduce=True`` the constraints are the proportional row groups of ``A``
+    (see ``pt_slab.reduction``; pass ``groups`` if already computed), which do not depend
+    on the load; each solve maps the load vector to per-group targets, so the reduced
+    LP is reused across load cases.
+    """
+
+    def __init__(self, A, stress_per_tendon, n_cord_max, reduce=True, solver=None, groups=None):
+        import cvxpy as cp  # deferred: ~1 s import, not needed by the HiGHS paths
+
+        self.A = A
+        self.solver = solver or cp.ECOS
+        self.groups = (groups or proportional_groups(A)) if reduce else None
+        if self.groups is not None:
+            lhs, n_rows = self.groups.directions(A), self.groups.n_groups
+        else:
+            lhs, n_rows = A, A.shape[0]
+
+        self.n = cp.Variable(A.shape[1])
+        self.load = cp.Parameter(n_rows)
+        self.stress_per_tendon = cp.Parameter(nonneg=True, value=float(stress_per_tendon))
+        self.n_cord_max = cp.Parameter(nonneg=True, value=float(n_cord_max))
+
+        stress = self.n * self.stress_per_tendon
+        if isinstance(lhs, InfluenceOperator):
+            stress_constraints = lhs.cvxpy_constraints(stress, self.load)
+        else:
+            stress_constraints = [lhs @ stress >= self.load]
+        self.problem = cp.Problem(cp.Minimize(cp.sum(self.n)), stress_constraints + [
+            self.n >= 0,
+            self.n <= self.n_cord_max,
+        ])
+
+    @property
+    def n_rows(self):
+        return self.load.size
+
+    def solve(self, load_vector, stress_per_tendon=None, n_cord_max=None, **solve_kwargs):
+        """Solve for one load case; with ``reduce=True``, ``active_rows`` holds the binding control
+        point of each group and ``duals`` are per control point of ``active_rows``."""
+        load_vector = np.asarray(load_vector, dtype=float)
+        self.load.value = self.groups.targets(load_vector) if self.groups is not None else load_vector
+        if stress_per_tendon is not None:
+            self.stress_per_tendon.value = float(stress_per_tendon)
+        if n_cord_max is not None:
+            self.n_cord_max.value = float(n_cord_max)
+
+        t0 = time.perf_counter()
+        self.problem.solve(solver=self.solver, warm_start=True, **solve_kwargs)
+        solve_time = time.perf_counter() - t0
+        x = self.n.value if self.problem.status == "optimal" else None
+        result = SolveResult(x, self.problem.status, self.problem.value, solve_time,
+                             **cvxpy_duals(self.problem.constraints))
+        if self.groups is not None:
+            # Group row = A[i] / scale[i] >= b[i] / scale[i] for its binding point i
+            result.active_rows = self.groups.binding_rows(load_vector)
+            if result.duals is not None:
+                scale = self.groups.scale[result.active_rows]
+                result.duals = np.divide(result.duals, scale, out=np.zeros_like(result.duals), where=scale > 0)
+        return result
+
+
+# ------------------------------------------------------
+# CONSTRAINT GENERATION (ACTIVE SET)
+# ------------------------------------------------------
+
+# Only a handful of the Npc stress constraints are binding at the optimum. Solve on a
+# small seed subset, check all points with one matvec, add the worst violated rows and
+# re-solve until the full set is satisfied. Memory is driven by the active set, not Npc.
+
+
+def seed_rows(demand, seed_size):
+    """Indices of the ``seed_size`` most demanding control points."""
+    seed_size = min(seed_size, len(demand))
+    return np.sort(np.argpartition(-demand, seed_size - 1)[:seed_size])
+
+
+def solve_constraint_generation(A, load_vector, stress_per_tendon, n_cord_max, seed_size=None,
+                                batch_size=None, tol=1e-7, max_iter=100, backend="cvxpy"):
+    """Solve the strand LP by iteratively adding the most violated control points.
+
+    Each pass re-solves the LP on the active rows with ``backend`` (a name or an
+    ``LPBackend``) and evaluates all control points with a single ``A @ x``. The
+    previous strand values are passed as ``x0``, but ECOS and HiGHS ``linprog`` ignore
+    it, so with the built-in backends every pass is a cold solve. Stops when no point
+    is violated beyond ``tol`` (relative to ``1 + |target|``).
+    """
+    backend = get_backend(backend)
+    load_vector = np.asarray(load_vector)
+    n_tendons = A.shape[1]
+    seed_size = seed_size or 4 * n_tendons
+    batch_size = batch_size or 2 * n_tendons
+
+    # Target per unit of total influence; margins are ranked on the same scale so that
+    # rows of one proportional group do not crowd out the rest of the slab
+    row_sum = induced_stress(A, np.ones(n_tendons), 1.0)
+    scale = np.where(row_sum > 0, row_sum, 1.0)
+    active = seed_rows(load_vector / scale, seed_size)
+    x, solve_time = None, 0.0
+    for iteration in range(1, max_iter + 1):
+        result = backend.solve(A[active], load_vector[active], stress_per_tendon, n_cord_max, x0=x)
+        solve_time += result.solve_time
+        status, objective = result.status, result.objective
+        if not result.optimal:
+            break
+        x = result.x
+
+        margin = stress_margin(A, x, load_vector, stress_per_tendon)
+        violated = np.flatnonzero(margin < -tol * (1 + np.abs(load_vector)))
+        if len(violated) == 0:
+            break
+        if len(violated) > batch_size:
+            # Half the batch: worst violations; other half: spread over the violated
+            # points (index order follows the mesh) so every region of the slab is probed
+            k = batch_size // 2
+            worst = violated[np.argpartition(margin[violated] / scale[violated], k - 1)[:k]]
+            spread = violated[np.linspace(0, len(violated) - 1, batch_size - k).astype(int)]
+            violated = np.union1d(worst, spread)
+        active = np.union1d(active, violated)
+    else:
+        status = "max_iter_reached"
+
+    if status not in ("optimal", "max_iter_reached"):
+        x = None
+    if status != "optimal":
+        # the last solve ran on fewer rows than ``active``
+        return SolveResult(x, status, objective, solve_time, iteration, active)
+    return SolveResult(x, status, objective, solve_time, iteration, active, duals=result.duals,
+                       upper_duals=result.upper_duals, lower_duals=result.lower_duals)
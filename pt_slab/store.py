@@ -0,0 +1,181 @@
+import json
+import os
+
+import numpy as np
+
+from .geometry import ControlGrid, ControlPoints
+from .operators import InfluenceOperator
+
+# ------------------------------------------------------
+# ON-DISK INFLUENCE MATRIX STORE (MEMORY-MAPPED .npy)
+# ------------------------------------------------------
+
+# A matrix obtained from FEA influence load cases is expensive to regenerate, and at
+# millions of nodes it may not fit in RAM. A store is a directory of plain .npy files
+# (one array per file, like a Zarr group) plus meta.json:
+#
+#   meta.json                  kind ("dense", "csr" or "operator"), shape, dtype, user attrs
+#   A.npy                      dense  (Npc × n_tendons, C order)
+#   A.data/indices/indptr.npy  csr
+#   A.lateral.npy, A.ecc.npy   operator (separable factors)
+#   X.npy, Y.npy               control point coordinates
+#   x_control.npy, y_control.npy   grid axes (regular grids only)
+#   tendon_x_positions.npy
+#
+# Reopening maps the files (np.load(mmap_mode="r")): nothing is read until used and the
+# OS pages rows in and out, so matrix-vector products work on matrices larger than RAM.
+# meta.json is written last: a store whose writer died midway is never opened.
+
+_META = "meta.json"
+_FORMAT_VERSION = 1
+
+
+class InfluenceStore:
+    """Influence matrix, control points and tendon positions saved under ``path``.
+
+    Use ``save`` for a matrix in memory, ``create`` + ``write_rows`` + ``close`` to fill a
+    dense matrix by row blocks without holding it, and ``open`` to map a saved store.
+    ``A`` is a ``np.memmap`` (dense), a CSR matrix over mapped arrays or an ``InfluenceOperator``.
+    """
+
+    def __init__(self, path, A, points, tendon_x_positions, attrs=None):
+        self.path = os.fspath(path)
+        self.A = A
+        self.points = points
+        self.tendon_x_positions = tendon_x_positions
+        self.attrs = dict(attrs or {})
+
+    @property
+    def shape(self):
+        return self.A.shape
+
+    # -- writing ------------------------------------------------------------
+
+    @classmethod
+    def save(cls, path, A, points, tendon_x_positions, attrs=None):
+        """Write ``A`` (dense, scipy sparse or ``InfluenceOperator``) and its geometry to ``path``."""
+        os.makedirs(path, exist_ok=True)
+        _remove_meta(path)
+        if isinstance(A, InfluenceOperator):
+            kind = "operator"
+            _save(path, "A.lateral", A.lateral)
+            _save(path, "A.ecc", A.ecc)
+        elif hasattr(A, "tocsr"):
+            kind = "csr"
+            A = A.tocsr()
+            for name in ("data", "indices", "indptr"):
+                _save(path, f"A.{name}", getattr(A, name))
+        else:
+            kind = "dense"
+            _save(path, "A", np.ascontiguousarray(A))
+        _save_geometry(path, points, tendon_x_positions)
+        _write_meta(path, kind, A.shape, A.dtype, attrs)
+        return cls.open(path)
+
+    @classmethod
+    def create(cls, path, points, tendon_x_positions, dtype=np.float64, attrs=None):
+        """Empty dense store opened for writing; fill with ``write_rows`` then ``close``."""
+        os.makedirs(path, exist_ok=True)
+        _remove_meta(path)
+        tendon_x_positions = np.asarray(tendon_x_positions)
+        shape = (len(points.X), len(tendon_x_positions))
+        A = np.lib.format.open_memmap(os.path.join(path, "A.npy"), mode="w+", dtype=dtype, shape=shape)
+        _save_geometry(path, points, tendon_x_positions)
+        store = cls(path, A, points, tendon_x_positions, attrs)
+        store._pending = (shape, np.dtype(dtype))
+        return store
+
+    def write_rows(self, start, block):
+        """Copy ``block`` into rows ``start:start + len(block)`` of a store from ``create``."""
+        self.A[start:start + len(block)] = block
+
+    def close(self):
+        """Flush a store from ``create`` and mark it complete; returns it reopened read-only."""
+        shape, dtype = self._pending
+        self.A.flush()
+        del self.A
+        _write_meta(self.path, "dense", shape, dtype, self.attrs)
+        return self.open(self.path)
+
+    # -- reading ------------------------------------------------------------
+
+    @classmethod
+    def open(cls, path, mmap_mode="r"):
+        """Map a saved store (zero-copy); ``mmap_mode=None`` loads it into memory instead."""
+        meta = read_meta(path)
+        kind = meta["kind"]
+        if kind == "dense":
+            A = _load(path, "A", mmap_mode)
+        elif kind == "csr":
+            from scipy import sparse
+
+            A = sparse.csr_matrix(tuple(_load(path, f"A.{name}", mmap_mode) for name in ("data", "indices", "indptr")),
+                                  shape=tuple(meta["shape"]), copy=False)
+        elif kind == "operator":
+            A = InfluenceOperator(_load(path, "A.lateral", mmap_mode), _load(path, "A.ecc", mmap_mode))
+        else:
+            raise ValueError(f"{path}: unknown influence store kind {kind!r}")
+
+        X, Y = _load(path, "X", mmap_mode), _load(path, "Y", mmap_mode)
+        if os.path.exists(os.path.join(path, "x_control.npy")):
+            points = ControlGrid.__new__(ControlGrid)
+            points.x_control = _load(path, "x_control", None)
+            points.y_control = _load(path, "y_control", None)
+            points.X, points.Y = X, Y
+        else:
+            points = ControlPoints.__new__(ControlPoints)
+            points.X, points.Y = X, Y
+        return cls(path, A, points, _load(path, "tendon_x_positions", None), meta["attrs"])
+
+    @staticmethod
+    def exists(path):
+        """True if ``path`` holds a complete store."""
+        return os.path.exists(os.path.join(path, _META))
+
+
+def read_meta(path):
+    """Metadata of a complete store; ``FileNotFoundError`` if absent or unfinished."""
+    try:
+        with open(os.path.join(path, _META), encoding="utf-8") as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{path}: no complete influence store ({_META} missing)") from None
+    if meta.get("version") != _FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported influence store version {meta.get('version')!r}")
+    return meta
+
+
+def _save(path, name, array):
+    np.save(os.path.join(path, name + ".npy"), np.asarray(array), allow_pickle=False)
+
+
+def _load(path, name, mmap_mode):
+    return np.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode, allow_pickle=False)
+
+
+def _save_geometry(path, points, tendon_x_positions):
+    _save(path, "X", points.X)
+    _save(path, "Y", points.Y)
+    for name in ("x_control", "y_control"):
+        file = os.path.join(path, name + ".npy")
+        if isinstance(points, ControlGrid):
+            _save(path, name, getattr(points, name))
+        elif os.path.exists(file):
+            os.remove(file)
+    _save(path, "tendon_x_positions", tendon_x_positions)
+
+
+def _write_meta(path, kind, shape, dtype, attrs):
+    meta = dict(version=_FORMAT_VERSION, kind=kind, shape=list(shape), dtype=np.dtype(dtype).str,
+                attrs=dict(attrs or {}))
+    tmp = os.path.join(path, _META + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=1)
+    os.replace(tmp, os.path.join(path, _META))
+
+
+def _remove_meta(path):
+    try:
+        os.remove(os.path.join(path, _META))
+    except FileNotFoundError:
+        pass
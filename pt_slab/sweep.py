@@ -0,0 +1,143 @@
+"""Parametric sweeps over live load, slab thickness and tendon spacing.
+
+Usage (from the repository root):
+    python -m pt_slab.sweep --q-live 2:10:9 --t-slab 0.30,0.35,0.40 --tendon-spacing 0.8,1.0,1.2 -o sweep.csv
+
+Values are comma-separated lists or ``start:stop:count`` ranges (both ends included).
+Every other parameter keeps its ``SlabConfig`` default (with the batch solver settings).
+"""
+import argparse
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import partial
+
+import numpy as np
+
+from .batch import BATCH_DEFAULTS, RESULT_FIELDS, result_row, write_results
+from .cache import InfluenceCache, influence_key
+from .optimizer import SharedInfluence, SlabConfig, optimize_slab
+
+SWEEP_PARAMS = ("q_live", "t_slab", "tendon_spacing")
+SWEEP_FIELDS = list(SWEEP_PARAMS) + [name for name in RESULT_FIELDS if name != "name"]
+
+# Points are grouped by geometry (influence_key): a group builds A, its reduction groups
+# and the compiled LP once and solves its load cases in increasing q_live order (each one
+# from scratch: the reduced LP is small). Groups (split further when there are fewer
+# groups than workers) run in a process pool; rows come back in the order of the input
+# points.
+
+
+def sweep_points(q_live=None, t_slab=None, tendon_spacing=None, config=None):
+    """Full grid of parameter points (dicts); ``None`` keeps the value of ``config``."""
+    config = config or SlabConfig()
+    axes = [np.atleast_1d(getattr(config, name) if values is None else values).tolist()
+            for name, values in zip(SWEEP_PARAMS, (q_live, t_slab, tendon_spacing))]
+    return [dict(zip(SWEEP_PARAMS, values)) for values in itertools.product(*axes)]
+
+
+def plan_sweep(points, config=None, n_tasks=1):
+    """Tasks of ``(index, point)`` pairs: one geometry per task, loads in increasing order.
+
+    Geometries with more points than needed are split into contiguous runs so that
+    there are about ``n_tasks`` tasks.
+    """
+    config = config or SlabConfig()
+    by_geometry = {}
+    for index, point in enumerate(points):
+        by_geometry.setdefault(influence_key(replace(config, **point)), []).append((index, point))
+    tasks = []
+    splits = max(1, math.ceil(n_tasks / max(len(by_geometry), 1)))
+    for group in by_geometry.values():
+        group.sort(key=lambda item: item[1].get("q_live", config.q_live))
+        size = math.ceil(len(group) / min(splits, len(group)))
+        tasks += [group[i:i + size] for i in range(0, len(group), size)]
+    return tasks
+
+
+def _run_task(task, config, cache=None):
+    rows = []
+    try:
+        shared = SharedInfluence.from_config(replace(config, **task[0][1]), cache)
+    except Exception as exc:  # a bad geometry must not sink the sweep
+        return [(index, _error_row(point, exc)) for index, point in task]
+    for index, point in task:
+        t_start = time.perf_counter()
+        try:
+            result = optimize_slab(config, influence=shared, **point)
+        except Exception as exc:
+            rows.append((index, _error_row(point, exc)))
+            continue
+        row = result_row(result, wall_time=time.perf_counter() - t_start)
+        del row["name"]
+        rows.append((index, {**point, **row}))
+    return rows
+
+
+def _error_row(point, exc):
+    row = dict.fromkeys(SWEEP_FIELDS, "")
+    row.update(point, status="error", error=f"{type(exc).__name__}: {exc}")
+    return row
+
+
+def run_sweep(points, config=None, max_workers=None, cache=None):
+    """Optimize every parameter point (dicts of ``SWEEP_PARAMS`` values) on top of ``config``.
+
+    Returns one tidy row per point (``SWEEP_FIELDS``), in the order of ``points``.
+    ``max_workers=1`` runs in-process; ``cache`` is an ``InfluenceCache`` for the matrices.
+    """
+    config = config or SlabConfig(**BATCH_DEFAULTS)
+    points = list(points)
+    max_workers = max_workers or os.cpu_count()
+    if max_workers > 1:
+        config = replace(config, check_workers=1)   # the pool already uses every core
+    run = partial(_run_task, config=config, cache=cache)
+    tasks = plan_sweep(points, config, n_tasks=max_workers)
+    if max_workers == 1:
+        done = map(run, tasks)
+        return _in_order(done, len(points))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return _in_order(pool.map(run, tasks), len(points))
+
+
+def _in_order(task_rows, n_points):
+    rows = [None] * n_points
+    for task in task_rows:
+        for index, row in task:
+            rows[index] = row
+    return rows
+
+
+def _parse_values(text):
+    if text is None:
+        return None
+    if ":" in text:
+        start, stop, count = text.split(":")
+        return np.linspace(float(start), float(stop), int(count)).round(10).tolist()
+    return [float(value) for value in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep the PT strand optimization over a parameter grid.")
+    parser.add_argument("--q-live", help="live loads (kN/m²)")
+    parser.add_argument("--t-slab", help="slab thicknesses (m)")
+    parser.add_argument("--tendon-spacing", help="tendon spacings (m)")
+    parser.add_argument("-o", "--output", default="sweep.csv")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--cache", metavar="DIR", help="reuse influence matrices stored in DIR")
+    args = parser.parse_args(argv)
+
+    points = sweep_points(_parse_values(args.q_live), _parse_values(args.t_slab), _parse_values(args.tendon_spacing))
+    cache = InfluenceCache(args.cache) if args.cache else None
+    t0 = time.perf_counter()
+    rows = run_sweep(points, max_workers=args.workers, cache=cache)
+    write_results(rows, args.output, fields=SWEEP_FIELDS)
+    n_ok = sum(row["feasible"] is True for row in rows)
+    print(f"{n_ok}/{len(rows)} points optimized in {time.perf_counter() - t0:.1f} s → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from .operators import InfluenceOperator
+
+# ------------------------------------------------------
+# VERIFICATION
+# ------------------------------------------------------
+
+# With precision="float32" the influence matrix and the stress fields are stored in
+# float32 (about 7 significant digits, plenty for influence coefficients) but every
+# matvec accumulates in float64: row blocks of A are upcast one at a time, never the
+# whole matrix. A and strands are non-negative, so storage rounding moves a stress by
+# at most a few eps32 · (|stress| + |b|); the band of 16 eps32 also covers kernels
+# evaluated in float32. Only rows whose margin is inside that band can be decided
+# wrongly, and those are re-evaluated from float64 rows (see ``exact_rows``).
+
+
+def induced_stress(A, x, stress_per_tendon, block_rows=1 << 12):
+    """Post-tensioning stress at every control point for ``x`` strands per tendon, in float64."""
+    v = np.asarray(x, dtype=np.float64) * stress_per_tendon
+    if isinstance(A, InfluenceOperator) or np.dtype(A.dtype) == np.float64:
+        return np.asarray(A @ v, dtype=np.float64).ravel()
+    out = np.empty(A.shape[0])
+    for start in range(0, A.shape[0], block_rows):
+        out[start:start + block_rows] = A[start:start + block_rows].astype(np.float64) @ v
+    return out
+
+
+def near_binding(stress, load_vector, dtype=np.float32, safety=16.0):
+    """Rows whose margin ``stress - load_vector`` is within the storage rounding of ``dtype``."""
+    band = safety * np.finfo(dtype).eps * (np.abs(stress) + np.abs(load_vector))
+    return np.flatnonzero(np.abs(stress - load_vector) <= band)
+
+
+# ------------------------------------------------------
+# FUSED BLOCKED CHECK (PRECHECK AND FINAL VERIFICATION)
+# ------------------------------------------------------
+
+# The precheck and the post-rounding check only need a few numbers: how many control
+# points miss their target, by how much at worst, and where. check_stress walks A in
+# row blocks of about 1 MiB (they stay in cache while the margins are formed) on a
+# thread pool (BLAS and scipy's sparse matvec release the GIL) and reduces each block
+# to (count, worst margin, k worst violated rows) before the next one: scratch memory
+# is a few blocks per thread, whatever Npc. Dense, memory-mapped and sparse A are read
+# through the same A[start:stop] slices; an InfluenceOperator forms G @ v once and each
+# block's stresses from it.
+
+
+@dataclass
+class StressCheck:
+    n_violations: int             # control points with induced stress below the target
+    worst_margin: float           # min over all points of induced minus target stress (MPa)
+    worst_rows: np.ndarray        # up to top_k most violated control points, most violated first
+    worst_margins: np.ndarray     # their margins (< 0)
+
+
+def _row_blocks(A, v):
+    """``stress(start, stop) -> A[start:stop] @ v`` in float64.
+
+    For an ``InfluenceOperator``, ``start`` and ``stop`` must be multiples of ``Ny``.
+    """
+    if isinstance(A, InfluenceOperator):
+        Gv = A.lateral @ v
+        ecc = A.ecc.astype(np.float64)
+        Ny = len(ecc)
+
+        def stress(start, stop):
+            return np.multiply.outer(Gv[start // Ny:stop // Ny], ecc).ravel()
+        return stress
+    if hasattr(A, "tocsr"):
+        A = A.tocsr()
+
+        def stress(start, stop):
+            # CSR rows from slices of the index arrays (cheaper than A[start:stop])
+            p0, p1 = A.indptr[start], A.indptr[stop]
+            block = type(A)((A.data[p0:p1], A.indices[p0:p1], A.indptr[start:stop + 1] - p0),
+                            shape=(stop - start, A.shape[1]))
+            return np.asarray(block.astype(np.float64, copy=False) @ v).ravel()
+        return stress
+
+    def stress(start, stop):
+        block = A[start:stop]
+        if block.dtype != np.float64:
+            block = block.astype(np.float64)
+        return np.asarray(block @ v).ravel()
+    return stress
+
+
+def _worst(rows, margins, k):
+    """The ``k`` most negative margins (ties by row index), most negative first."""
+    order = np.lexsort((rows, margins))[:k]
+    return rows[order], margins[order]
+
+
+def check_stress(A, x, load_vector, stress_per_tendon, top_k=10, exact_rows=None, out=None,
+                 block_rows=None, max_workers=None):
+    """Violation count, worst margin and ``top_k`` most violated rows in one blocked pass.
+
+    ``exact_rows`` re-evaluates near-binding rows in float64 (see ``near_binding``);
+    ``out`` is an optional ``(Npc,)`` array that receives the induced stress (e.g. the
+    result field, in its own dtype). ``block_rows`` defaults to about 1 MiB of float64
+    rows; ``max_workers`` threads (``os.cpu_count()`` by default, 1 runs in the caller).
+    """
+    v = np.asarray(x, dtype=np.float64) * stress_per_tendon
+    n_rows, n_tendons = A.shape
+    block_rows = block_rows or max(1024, (1 << 20) // (8 * n_tendons))
+    if isinstance(A, InfluenceOperator):
+        # whole x_control columns per block
+        Ny = A.grid_shape[1]
+        block_rows = max(block_rows // Ny, 1) * Ny
+    row_stress = _row_blocks(A, v)
+
+    def check_block(start):
+        stop = min(start + block_rows, n_rows)
+        stress = row_stress(start, stop)
+        margin = stress - load_vector[start:stop]
+        if exact_rows is not None:
+            near = near_binding(stress, load_vector[start:stop])
+            if len(near):
+                A_rows, load_rows = exact_rows(start + near)
+                stress[near] = A_rows @ v
+                margin[near] = stress[near] - load_rows
+        if out is not None:
+            out[start:stop] = stress
+        violated = np.flatnonzero(margin < 0)
+        worst = violated[np.argpartition(margin[violated], top_k)[:top_k]] if len(violated) > top_k > 0 \
+            else violated[:top_k]
+        return len(violated), margin.min(initial=np.inf), start + worst, margin[worst]
+
+    starts = range(0, n_rows, block_rows)
+    max_workers = min(max_workers or os.cpu_count(), len(starts))
+    if max_workers <= 1:
+        return _reduce_blocks(map(check_block, starts), top_k)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return _reduce_blocks(pool.map(check_block, starts), top_k)
+
+
+def _reduce_blocks(blocks, top_k):
+    n_violations, worst_margin = 0, np.inf
+    rows, margins = np.empty(0, dtype=np.intp), np.empty(0)
+    for count, block_worst, block_rows, block_margins in blocks:
+        n_violations += count
+        worst_margin = min(worst_margin, block_worst)
+        if len(block_rows):
+            rows, margins = _worst(np.append(rows, block_rows), np.append(margins, block_margins), top_k)
+    return StressCheck(n_violations, float(worst_margin), rows, margins)
+
+
+def count_violations(A, x, load_vector, stress_per_tendon, exact_rows=None, max_workers=None):
+    """Number of control points where the induced stress does not reach the target."""
+    return check_stress(A, x, load_vector, stress_per_tendon, top_k=0, exact_rows=exact_rows,
+                        max_workers=max_workers).n_violations
+
+
+def precheck(A, load_vector, stress_per_tendon, n_cord_max, exact_rows=None, max_workers=None):
+    """Violations with every tendon at ``n_cord_max`` strands (0 means the problem is feasible)."""
+    return count_violations(A, np.full(A.shape[1], n_cord_max), load_vector, stress_per_tendon, exact_rows,
+                            max_workers)
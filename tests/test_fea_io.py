@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pt_slab import read_node_stress_csv
+
+
+class ReadNodeStressCsvTest(unittest.TestCase):
+
+    def read(self, text, **kwargs):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "nodes.csv")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                f.write(text)
+            return read_node_stress_csv(path, **kwargs)
+
+    def assert_nodes(self, nodes, X, Y, S):
+        np.testing.assert_allclose(nodes.X, X)
+        np.testing.assert_allclose(nodes.Y, Y)
+        np.testing.assert_allclose(nodes.values, S)
+
+    def test_plain(self):
+        self.assert_nodes(self.read("X,Y,S\n0.5,0.5,1.0\n1.5,2.0,-3.25\n"), [0.5, 1.5], [0.5, 2.0], [1.0, -3.25])
+
+    def test_quoted_fields(self):
+        nodes = self.read('"X","Y","S"\n"0.5","0.5","1.0"\n"1.5","2.0","-3.25"\n')
+        self.assert_nodes(nodes, [0.5, 1.5], [0.5, 2.0], [1.0, -3.25])
+
+    def test_decimal_comma(self):
+        nodes = self.read("X;Y;S\n0,5;0,5;1,0\n1,5;2;-3,25\n", decimal=",")
+        self.assert_nodes(nodes, [0.5, 1.5], [0.5, 2.0], [1.0, -3.25])
+
+    def test_units_row_and_column_names(self):
+        nodes = self.read("Node,GlobalX,GlobalY,S22\n,m,m,kN/m2\n1,0.5,0.5,1000\n2,1.5,2.0,-3250\n",
+                          x_col="globalx", y_col="GlobalY", stress_col="S22", scale=1e-3)
+        self.assert_nodes(nodes, [0.5, 1.5], [0.5, 2.0], [1.0, -3.25])
+
+    def test_crlf_quoted_decimal_comma_with_units(self):
+        text = '"X";"Y";"S"\r\n"m";"m";"MPa"\r\n"0,5";"0,5";"1,0"\r\n"1,5";"2";"-3,25"\r\n'
+        self.assert_nodes(self.read(text, decimal=","), [0.5, 1.5], [0.5, 2.0], [1.0, -3.25])
+
+    def test_chunks(self):
+        rows = "".join(f"{i},{2 * i},{-i}\n" for i in range(10))
+        nodes = self.read("X,Y,S\n" + rows, chunk_rows=3)
+        self.assert_nodes(nodes, np.arange(10), 2 * np.arange(10), -np.arange(10))
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            self.read("X,Y,Sxx\n0,0,1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
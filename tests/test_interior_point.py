@@ -0,0 +1,109 @@
+import unittest
+
+import numpy as np
+import scipy.sparse as sparse
+
+from pt_slab import optimize_slab
+from pt_slab.backends import get_backend
+from pt_slab.interior_point import solve_interior_point
+from pt_slab.operators import InfluenceOperator
+
+STRESS_PER_TENDON = 0.35  # MPa per strand
+N_CORD_MAX = 12
+
+
+def random_targets(A, rng, fill=0.5):
+    """Targets reachable with about ``fill * N_CORD_MAX`` strands per tendon (so feasible)."""
+    x = rng.uniform(0, fill * N_CORD_MAX, A.shape[1])
+    return np.asarray(A @ x).ravel() * STRESS_PER_TENDON * rng.uniform(0.3, 1.0, A.shape[0])
+
+
+class InteriorPointVsHighsTest(unittest.TestCase):
+
+    def assert_matches_highs(self, A, load_vector):
+        ipm = solve_interior_point(A, load_vector, STRESS_PER_TENDON, N_CORD_MAX)
+        highs = get_backend("highs").solve(A, load_vector, STRESS_PER_TENDON, N_CORD_MAX)
+        self.assertEqual(highs.status, "optimal")
+        self.assertEqual(ipm.status, "optimal")
+        self.assertAlmostEqual(ipm.objective, highs.objective, delta=1e-6 * max(1.0, highs.objective))
+        stress = np.asarray(A @ ipm.x).ravel() * STRESS_PER_TENDON
+        self.assertGreaterEqual((stress - load_vector).min(), -1e-6 * np.abs(load_vector).max())
+        self.assertTrue(np.all((ipm.x >= 0) & (ipm.x <= N_CORD_MAX)))
+
+    def test_dense(self):
+        rng = np.random.default_rng(0)
+        for m, T in [(200, 5), (2000, 20), (5000, 40)]:
+            A = rng.uniform(0, 1, (m, T))
+            self.assert_matches_highs(A, random_targets(A, rng))
+
+    def test_sparse(self):
+        rng = np.random.default_rng(1)
+        A = sparse.random(3000, 30, density=0.2, format="csr", random_state=rng)
+        A = A[np.flatnonzero(A.getnnz(axis=1))]
+        self.assert_matches_highs(A, random_targets(A, rng))
+
+    def test_operator(self):
+        rng = np.random.default_rng(2)
+        A = InfluenceOperator(rng.uniform(0, 1, (60, 25)), rng.uniform(0.2, 1, 40))
+        load_vector = random_targets(A, rng)
+        self.assert_matches_highs(A, load_vector)
+        self.assert_matches_highs(A[np.arange(A.shape[0])], load_vector)  # same matrix, dense
+
+    def test_float32_matrix(self):
+        rng = np.random.default_rng(3)
+        A = rng.uniform(0, 1, (2000, 20))
+        load_vector = random_targets(A, rng)
+        ipm = solve_interior_point(A.astype(np.float32), load_vector, STRESS_PER_TENDON, N_CORD_MAX)
+        highs = get_backend("highs").solve(A, load_vector, STRESS_PER_TENDON, N_CORD_MAX)
+        self.assertEqual(ipm.status, "optimal")
+        self.assertAlmostEqual(ipm.objective, highs.objective, delta=1e-4 * highs.objective)
+
+
+class InteriorPointEdgeCasesTest(unittest.TestCase):
+
+    def test_infeasible_certificate(self):
+        rng = np.random.default_rng(4)
+        A = rng.uniform(0, 1, (500, 10))
+        load_vector = random_targets(A, rng)
+        load_vector[17] = 1.5 * STRESS_PER_TENDON * N_CORD_MAX * A[17].sum()  # out of reach
+        ipm = solve_interior_point(A, load_vector, STRESS_PER_TENDON, N_CORD_MAX)
+        highs = get_backend("highs").solve(A, load_vector, STRESS_PER_TENDON, N_CORD_MAX)
+        self.assertEqual(highs.status, "infeasible")
+        self.assertEqual(ipm.status, "infeasible")
+        self.assertIsNone(ipm.x)
+        self.assertFalse(ipm.optimal)
+
+    def test_all_targets_non_positive(self):
+        rng = np.random.default_rng(5)
+        A = rng.uniform(0, 1, (1000, 15))
+        load_vector = -rng.uniform(0, 2, 1000)
+        load_vector[::7] = 0.0
+        ipm = solve_interior_point(A, load_vector, STRESS_PER_TENDON, N_CORD_MAX)
+        self.assertEqual(ipm.status, "optimal")
+        self.assertLess(ipm.objective, 1e-6)
+        np.testing.assert_allclose(ipm.x, 0, atol=1e-6)
+
+    def test_ceil_mode_agrees_with_highs(self):
+        # interior-point noise just above 0 must not round up to a strand
+        for use_reduction in (True, False):
+            layouts = [optimize_slab(targets=lambda X, Y: np.zeros_like(X), lp_backend=backend, Npc=2000,
+                                     use_reduction=use_reduction, integer_mode="ceil").x_opt
+                       for backend in ("highs", "ipm")]
+            np.testing.assert_array_equal(layouts[0], 0)
+            np.testing.assert_array_equal(layouts[1], layouts[0])
+        layouts = [optimize_slab(lp_backend=backend, Npc=2000, integer_mode="ceil").x_opt
+                   for backend in ("highs", "ipm")]
+        np.testing.assert_array_equal(layouts[1], layouts[0])
+
+    def test_backend_registry(self):
+        rng = np.random.default_rng(6)
+        A = rng.uniform(0, 1, (300, 8))
+        load_vector = random_targets(A, rng)
+        result = get_backend("ipm").solve(A, load_vector, STRESS_PER_TENDON, N_CORD_MAX)
+        direct = solve_interior_point(A, load_vector, STRESS_PER_TENDON, N_CORD_MAX)
+        self.assertEqual(result.status, "optimal")
+        self.assertAlmostEqual(result.objective, direct.objective, places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()